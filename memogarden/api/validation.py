@@ -94,7 +94,7 @@ def _validate_request_body(model_class: type) -> BaseModel:
         MGValidationError: If validation fails.
     """
     try:
-        return model_class(**request.json)
+        return model_class.model_validate(request.json)
     except ValidationError as e:
         errors = _format_validation_errors(e.errors())
 
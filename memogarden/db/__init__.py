@@ -227,7 +227,11 @@ def get_core(atomic: bool = False) -> Core:
 # DATABASE INITIALIZATION
 # ============================================================================
 
-EXPECTED_SCHEMA_VERSION = "20251230"
+EXPECTED_SCHEMA_VERSION = "20261016"
+
+# Known schema versions in order. Each consecutive pair has a migration file
+# (migrate_<from>_to_<to>.sql), so older databases step forward one at a time.
+_MIGRATION_PATH = ["20251223", "20251229", "20251230", "20261016"]
 
 
 def _get_current_schema_version(db: sqlite3.Connection) -> str | None:
@@ -300,13 +304,16 @@ def _run_migrations(db: sqlite3.Connection) -> None:
         # Already at expected version, no migration needed
         return
 
-    # For now, we only support direct migration paths
-    if current_version == "20251223" and EXPECTED_SCHEMA_VERSION == "20251229":
-        _apply_migration(db, current_version, EXPECTED_SCHEMA_VERSION)
-    elif current_version == "20251229" and EXPECTED_SCHEMA_VERSION == "20251230":
-        _apply_migration(db, current_version, EXPECTED_SCHEMA_VERSION)
+    if current_version in _MIGRATION_PATH and current_version < EXPECTED_SCHEMA_VERSION:
+        # Apply each intermediate migration in order up to the expected version
+        start = _MIGRATION_PATH.index(current_version)
+        end = _MIGRATION_PATH.index(EXPECTED_SCHEMA_VERSION)
+        for from_version, to_version in zip(
+            _MIGRATION_PATH[start:end], _MIGRATION_PATH[start + 1:end + 1]
+        ):
+            _apply_migration(db, from_version, to_version)
     elif current_version < EXPECTED_SCHEMA_VERSION:
-        # Skip migrations for now (would need multi-step migration in production)
+        # Unknown older version - no migration path available
         # This allows development to continue without full migration support
         pass
     elif current_version > EXPECTED_SCHEMA_VERSION:
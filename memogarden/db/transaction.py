@@ -109,11 +109,16 @@ class TransactionOperations:
 
         date_str = isodatetime.to_datestring(transaction_date)
 
+        # Bind only native SQLite types (str/float/None) so sqlite3 never has
+        # to consult its adapter registry for these parameters.
         self._conn.execute(
             """INSERT INTO transactions
                (id, amount, currency, transaction_date, description, account, category, author, notes)
                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (transaction_id, amount, "SGD", date_str, description, account, category, author, notes)
+            (
+                transaction_id, float(amount), "SGD", date_str, description,
+                account, category, author, notes,
+            )
         )
 
         return transaction_id
@@ -139,28 +144,34 @@ class TransactionOperations:
         Returns:
             List of sqlite3.Row objects with transaction data
         """
+        # Most selective predicates first: label equality (served by the
+        # (label, transaction_date) indexes), then the date range
         param_map = {
-            "start_date": "t.transaction_date >= ?",
-            "end_date": "t.transaction_date <= ?",
             "account": "t.account = ?",
             "category": "t.category = ?",
+            "start_date": "t.transaction_date >= ?",
+            "end_date": "t.transaction_date <= ?",
         }
 
-        # Filter out None values and exclude non-column flags like include_superseded
+        # Filter out None values; iterating param_map also drops non-column
+        # flags like include_superseded and keeps the predicate order fixed
         conditions = {
-            k: v for k, v in filters.items()
-            if v is not None and k != "include_superseded"
+            k: filters[k] for k in param_map
+            if filters.get(k) is not None
         }
 
         where_clause, params = query.build_where_clause(conditions, param_map)
 
         # Handle superseded filter as special case (exclude if not explicitly included)
-        # This is added separately because "IS NULL" doesn't use a placeholder
+        # This is added separately because it doesn't use a placeholder.
+        # t.is_active mirrors e.superseded_by IS NULL (kept in sync by trigger).
+        # Keep the literal 1: the partial idx_transactions_active_date index
+        # only applies when the predicate matches its WHERE clause exactly.
         if not filters.get("include_superseded"):
             if where_clause == "1=1":
-                where_clause = "e.superseded_by IS NULL"
+                where_clause = "t.is_active = 1"
             else:
-                where_clause += " AND e.superseded_by IS NULL"
+                where_clause += " AND t.is_active = 1"
         params.extend([limit, offset])
 
         query_sql = f"""
@@ -0,0 +1,82 @@
+-- Migration: 20251230 -> 20261016
+-- Description: Composite label indexes and a denormalized is_active flag for transaction lists
+--
+-- Usage: Apply this migration to existing databases created with schema version 20251230
+--
+-- This migration:
+--   - Rebuilds the transactions table with an is_active column, backfilled from
+--     entity.superseded_by (SQLite has no ADD COLUMN IF NOT EXISTS, so the table is
+--     copied rather than altered to keep the migration safe to re-run)
+--   - Replaces the single-column account/category indexes with (label, transaction_date DESC)
+--     composites, so filtered lists are served in date order straight from the index
+--   - Adds a partial transaction_date DESC index over active rows (WHERE is_active = 1)
+--   - Adds a trigger that keeps is_active in sync when an entity is superseded
+
+-- Begin transaction for atomic migration
+BEGIN;
+
+-- Update schema version
+UPDATE _schema_metadata
+SET value = '20261016', updated_at = datetime('now')
+WHERE key = 'version';
+
+-- The view and trigger reference transactions; drop them while the table is rebuilt
+DROP VIEW IF EXISTS transactions_view;
+DROP TRIGGER IF EXISTS trg_entity_superseded_transactions;
+
+CREATE TABLE transactions_new (
+    id TEXT PRIMARY KEY,
+    amount REAL NOT NULL,
+    currency TEXT NOT NULL DEFAULT 'SGD',
+    transaction_date TEXT NOT NULL,  -- ISO 8601 date (YYYY-MM-DD)
+    description TEXT NOT NULL DEFAULT '',  -- Short title (e.g., "Coffee at Starbucks")
+    account TEXT NOT NULL,            -- Label: e.g., "Household", "Personal"
+    category TEXT,                    -- Label: e.g., "Food", "Transport"
+    author TEXT NOT NULL DEFAULT 'system',
+    recurrence_id TEXT,               -- FK to entity (type='recurrences')
+    notes TEXT,                       -- Optional longer details
+    is_active INTEGER NOT NULL DEFAULT 1,  -- 1 unless entity.superseded_by is set (kept in sync by trigger)
+
+    FOREIGN KEY (id) REFERENCES entity(id) ON DELETE CASCADE,
+    FOREIGN KEY (recurrence_id) REFERENCES entity(id)
+);
+
+INSERT INTO transactions_new
+    (id, amount, currency, transaction_date, description, account, category,
+     author, recurrence_id, notes, is_active)
+SELECT t.id, t.amount, t.currency, t.transaction_date, t.description, t.account,
+       t.category, t.author, t.recurrence_id, t.notes, (e.superseded_by IS NULL)
+FROM transactions t
+JOIN entity e ON t.id = e.id;
+
+DROP TABLE transactions;
+ALTER TABLE transactions_new RENAME TO transactions;
+
+-- Indexes were dropped with the old table (including the single-column
+-- idx_transactions_account/idx_transactions_category, which the composites replace)
+CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions(transaction_date);
+CREATE INDEX IF NOT EXISTS idx_transactions_account_date ON transactions(account, transaction_date DESC);
+CREATE INDEX IF NOT EXISTS idx_transactions_category_date ON transactions(category, transaction_date DESC);
+CREATE INDEX IF NOT EXISTS idx_transactions_active_date ON transactions(transaction_date DESC) WHERE is_active = 1;
+
+CREATE TRIGGER IF NOT EXISTS trg_entity_superseded_transactions
+AFTER UPDATE OF superseded_by ON entity
+WHEN NEW.type = 'transactions'
+BEGIN
+    UPDATE transactions SET is_active = (NEW.superseded_by IS NULL) WHERE id = NEW.id;
+END;
+
+CREATE VIEW IF NOT EXISTS transactions_view AS
+SELECT
+    t.*,
+    e.created_at,
+    e.updated_at,
+    e.superseded_by,
+    e.superseded_at,
+    e.group_id,
+    e.derived_from
+FROM transactions t
+JOIN entity e ON t.id = e.id;
+
+-- Commit migration
+COMMIT;
@@ -1,4 +1,4 @@
--- Schema Version: 20251230
+-- Schema Version: 20261016
 -- Base Schema: memogarden-core-v1
 -- Description: Schema with entity registry, transactions, users, API keys, and recurrences
 --
@@ -18,7 +18,7 @@ CREATE TABLE IF NOT EXISTS _schema_metadata (
 );
 
 INSERT INTO _schema_metadata VALUES
-    ('version', '20251230', datetime('now')),
+    ('version', '20261016', datetime('now')),
     ('base_schema', 'memogarden-core-v1', datetime('now')),
     ('description', 'Schema with entity registry, transactions, users, API keys, and recurrences', datetime('now'));
 
@@ -55,6 +55,7 @@ CREATE TABLE IF NOT EXISTS transactions (
     author TEXT NOT NULL DEFAULT 'system',
     recurrence_id TEXT,               -- FK to entity (type='recurrences')
     notes TEXT,                       -- Optional longer details
+    is_active INTEGER NOT NULL DEFAULT 1,  -- 1 unless entity.superseded_by is set (kept in sync by trigger)
 
     FOREIGN KEY (id) REFERENCES entity(id) ON DELETE CASCADE,
     FOREIGN KEY (recurrence_id) REFERENCES entity(id)
@@ -62,8 +63,20 @@ CREATE TABLE IF NOT EXISTS transactions (
 
 -- Indexes for query performance
 CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions(transaction_date);
-CREATE INDEX IF NOT EXISTS idx_transactions_account ON transactions(account);
-CREATE INDEX IF NOT EXISTS idx_transactions_category ON transactions(category);
+CREATE INDEX IF NOT EXISTS idx_transactions_account_date ON transactions(account, transaction_date DESC);
+CREATE INDEX IF NOT EXISTS idx_transactions_category_date ON transactions(category, transaction_date DESC);
+-- Partial, not (is_active, ...): a low-selectivity leading is_active column would
+-- win over the label indexes on filtered lists. Matches only the literal is_active = 1.
+CREATE INDEX IF NOT EXISTS idx_transactions_active_date ON transactions(transaction_date DESC) WHERE is_active = 1;
+
+-- Mirror entity supersession onto transactions.is_active so the default
+-- "active only" list filter needs no lookup in the entity table
+CREATE TRIGGER IF NOT EXISTS trg_entity_superseded_transactions
+AFTER UPDATE OF superseded_by ON entity
+WHEN NEW.type = 'transactions'
+BEGIN
+    UPDATE transactions SET is_active = (NEW.superseded_by IS NULL) WHERE id = NEW.id;
+END;
 
 -- Convenient view for querying transactions with metadata
 CREATE VIEW IF NOT EXISTS transactions_view AS
@@ -5,13 +5,17 @@ and ISO 8601 strings. All date/time operations should use these functions
 to ensure consistency and make usage clear across the codebase.
 """
 
+import time
 from datetime import UTC, date, datetime
 
 
 def to_timestamp(dt: datetime) -> str:
     """Convert datetime to ISO 8601 UTC timestamp string."""
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=UTC)
+    tz = dt.tzinfo
+    if tz is None:
+        return dt.isoformat() + "Z"
+    if tz is UTC:
+        return dt.replace(tzinfo=None).isoformat() + "Z"
     return dt.isoformat().replace("+00:00", "Z")
 
 
@@ -20,9 +24,26 @@ def to_datetime(timestamp: str) -> datetime:
     return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
 
 
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the most recent now() call.
+_now_prefix: tuple[int, str] = (-1, "")
+
+
 def now() -> str:
-    """Get current UTC timestamp as ISO 8601 string."""
-    return to_timestamp(datetime.now(UTC))
+    """Get current UTC timestamp as ISO 8601 string.
+
+    The date/time prefix is formatted once per wall-clock second and reused;
+    only the microsecond suffix is rendered on each call. Output matches
+    to_timestamp(datetime.now(UTC)) exactly.
+    """
+    global _now_prefix
+    second, micro = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_second, prefix = _now_prefix
+    if second != cached_second:
+        prefix = datetime.fromtimestamp(second, UTC).strftime("%Y-%m-%dT%H:%M:%S")
+        _now_prefix = (second, prefix)
+    if micro:
+        return f"{prefix}.{micro:06d}Z"
+    return f"{prefix}Z"
 
 
 def to_datestring(d: date) -> str:
@@ -164,6 +164,25 @@ class TestCreateTransaction:
         assert "error" in data
 
 
+    def test_create_transaction_non_object_body(self, client, auth_headers):
+        """A JSON body that is not an object should be a 400 validation error."""
+        response = client.post(
+            "/api/v1/transactions",
+            json=[1, 2],
+            headers=auth_headers
+        )
+
+        assert response.status_code == 400
+        data = response.get_json()
+        assert data["error"]["type"] == "ValidationError"
+        details = data["error"]["details"]
+        assert details["model"] == "TransactionCreate"
+        assert details["received"] == [1, 2]
+        assert details["errors"]
+        for error in details["errors"]:
+            assert set(error) == {"field", "message", "expected_type"}
+
+
 class TestGetTransaction:
     """Tests for GET /api/v1/transactions/{id}"""
 
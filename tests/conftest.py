@@ -1,6 +1,8 @@
 """Shared test fixtures for memogarden-core."""
 
+import atexit
 import os
+import shutil
 import tempfile
 import sqlite3
 from pathlib import Path
@@ -8,9 +10,26 @@ from pathlib import Path
 import pytest
 from flask import g
 
-from memogarden.main import app
 from memogarden.config import settings
-from memogarden.auth import schemas, service, token as auth_token, api_keys
+
+# Point the default database at a directory private to this test process
+# before the app is imported (importing memogarden.main initializes it).
+# Tests never touch ./data/, and parallel workers (pytest-xdist) never
+# contend for the same SQLite file.
+_TEST_DATA_DIR = tempfile.mkdtemp(prefix="memogarden-tests-")
+# Clean up at interpreter exit rather than in a session fixture: the xdist
+# controller, --collect-only, and usage errors import this module but never
+# run session fixtures.
+atexit.register(shutil.rmtree, _TEST_DATA_DIR, ignore_errors=True)
+settings.database_path = os.path.join(_TEST_DATA_DIR, "memogarden.db")
+
+from memogarden.main import app  # noqa: E402
+from memogarden.db import Core  # noqa: E402
+from memogarden.auth import schemas, service, token as auth_token, api_keys  # noqa: E402
+
+SCHEMA_SQL = (
+    Path(__file__).parent.parent / "memogarden" / "schema" / "schema.sql"
+).read_text()
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -27,26 +46,49 @@ def test_bcrypt_work_factor():
     settings.bcrypt_work_factor = original
 
 
-@pytest.fixture
-def test_db():
-    """Create in-memory test database with schema."""
-    # Use in-memory database for tests
-    db_path = ":memory:"
+@pytest.fixture(scope="session")
+def schema_template():
+    """Build the database schema once per test session.
+
+    test_db clones this connection page-by-page instead of re-running
+    schema.sql for every test. Read-only schema checks may query it
+    directly; tests must never write to it.
+    """
+    template = sqlite3.connect(":memory:")
+    template.executescript(SCHEMA_SQL)
+    template.commit()
+
+    yield template
+
+    template.close()
 
-    # Create database with schema
-    schema_path = Path(__file__).parent.parent / "memogarden" / "schema" / "schema.sql"
 
-    db = sqlite3.connect(db_path)
+@pytest.fixture
+def test_db(schema_template):
+    """Create in-memory test database with schema.
+
+    Each test gets its own private :memory: connection cloned from the
+    session schema template, so tests stay fully isolated (they may commit,
+    run migrations, or close the connection) without re-parsing the DDL.
+    """
+    db = sqlite3.connect(":memory:")
+    schema_template.backup(db)
     db.row_factory = sqlite3.Row
 
-    # Enable foreign key constraints (required for SQLite)
+    # Enable foreign key constraints (required for SQLite). This is
+    # per-connection state that backup() does not copy, and the *_requires_*
+    # FK tests depend on it.
     db.execute("PRAGMA foreign_keys = ON")
 
-    # Load and execute schema
-    with open(schema_path, "r") as f:
-        schema_sql = f.read()
-    db.executescript(schema_sql)
-    db.commit()
+    # Throwaway database: trade durability for speed
+    db.execute("PRAGMA journal_mode = MEMORY")
+    db.execute("PRAGMA synchronous = OFF")
+    db.execute("PRAGMA temp_store = MEMORY")
+    db.execute("PRAGMA cache_size = -65536")  # 64 MiB
+
+    # Parse the copied schema now, during setup, rather than in the test's
+    # first statement
+    db.execute("SELECT count(*) FROM sqlite_master").fetchone()
 
     yield db
 
@@ -55,25 +97,55 @@ def test_db():
 
 
 @pytest.fixture
-def client():
+def schema_db_path(schema_template, tmp_path):
+    """Path to a temp-file database seeded with the schema (same result as init_db()).
+
+    For tests that need several connections, or the app's own connections via
+    settings.database_path, to see the same data. pytest removes tmp_path.
+    """
+    db_path = str(tmp_path / "memogarden.db")
+    conn = sqlite3.connect(db_path)
+    schema_template.backup(conn)
+    conn.close()
+    return db_path
+
+
+@pytest.fixture
+def core(test_db):
+    """Core bound to the test database in autocommit mode.
+
+    Core caches its EntityOperations/TransactionOperations/RecurrenceOperations
+    on first access, so tests sharing this fixture reuse one set of
+    operations objects for the whole test.
+    """
+    return Core(test_db, atomic=False)
+
+
+@pytest.fixture(scope="session")
+def app_client():
+    """Session-wide test client for endpoints that never touch the database.
+
+    Use for app-level checks such as /health and CORS headers. Tests that
+    read or write data must use client, which provides a fresh database.
+    """
+    # No `with` block: a client used as a context manager keeps its last
+    # request context pushed, which would leak into every later test.
+    app.config['TESTING'] = True
+    return app.test_client()
+
+
+@pytest.fixture
+def client(schema_db_path):
     """Create test client for API testing.
 
     Uses shared in-memory database to avoid file locking issues during tests.
     Each test gets a fresh database.
     """
     # Use a temp file database instead of :memory: for proper sharing
-    fd, db_path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
+    original_db_path = settings.database_path
+    settings.database_path = schema_db_path
 
     try:
-        # Override database path
-        original_db_path = settings.database_path
-        settings.database_path = db_path
-
-        # Initialize the database with schema
-        from memogarden.db import init_db
-        init_db()
-
         app.config['TESTING'] = True
         with app.test_client() as client:
             yield client
@@ -82,12 +154,6 @@ def client():
         # Restore original database path
         settings.database_path = original_db_path
 
-        # Clean up temp file
-        try:
-            os.unlink(db_path)
-        except:
-            pass
-
 
 @pytest.fixture
 def test_user(test_db):
@@ -154,7 +220,7 @@ def api_key_headers(api_key):
 
 
 @pytest.fixture
-def authenticated_client():
+def authenticated_client(schema_db_path):
     """Create an authenticated test client with JWT token.
 
     This fixture creates a test user and returns a client that can make
@@ -169,25 +235,21 @@ def authenticated_client():
     Note: Uses bcrypt_work_factor=4 for fast test execution (set by
     test_bcrypt_work_factor session-scoped fixture).
     """
-    # Create temp file database
-    fd, db_path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
+    # Override database path with a fresh schema-seeded temp file
+    original_db_path = settings.database_path
+    settings.database_path = schema_db_path
 
     try:
-        # Override database path
-        original_db_path = settings.database_path
-        settings.database_path = db_path
-
-        # Initialize the database with schema
-        from memogarden.db import init_db, get_core
-        init_db()
+        from memogarden.db import _create_connection
 
-        # Create a test user in the database (fast with work factor 4)
-        core = get_core()
+        # Create a test user in the database (fast with work factor 4).
+        # service.create_user() only needs a connection, so skip building a Core.
+        conn = _create_connection()
         password = "TestPass123"
         user_data = schemas.UserCreate(username="testuser", password=password)
-        user = service.create_user(core._conn, user_data, is_admin=False)
-        core._conn.commit()
+        user = service.create_user(conn, user_data, is_admin=False)
+        conn.commit()
+        conn.close()
 
         # Generate JWT token
         user_response = schemas.UserResponse(
@@ -209,9 +271,3 @@ def authenticated_client():
     finally:
         # Restore original database path
         settings.database_path = original_db_path
-
-        # Clean up temp file
-        try:
-            os.unlink(db_path)
-        except:
-            pass
@@ -6,12 +6,25 @@ No mocks - testing observable behavior.
 
 import pytest
 import sqlite3
-from pathlib import Path
 from datetime import date
 from memogarden.db import get_core, Core, _create_connection
 from memogarden.exceptions import ResourceNotFound
 
 
+def _connect(db_path):
+    """Open a test connection to a temp-file database.
+
+    Durability pragmas are relaxed since the file is deleted after the test;
+    journal_mode=MEMORY still supports the rollbacks these tests check.
+    """
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA journal_mode = MEMORY")
+    conn.execute("PRAGMA synchronous = OFF")
+    return conn
+
+
 # ============================================================================
 # _create_connection tests
 # ============================================================================
@@ -111,108 +124,58 @@ def test_core_atomic_context_manager_enters(test_db):
         assert ctx is core
 
 
-def test_core_atomic_context_manager_commits_on_success():
+def test_core_atomic_context_manager_commits_on_success(schema_db_path):
     """Core context manager should commit on successful exit."""
-    # Use file-based database so we can open a new connection to verify
-    import tempfile
-    import os
+    # Create initial entity
+    conn1 = _connect(schema_db_path)
+    core1 = Core(conn1, atomic=True)
+    entity_id_1 = core1.entity.create("transactions")
+    conn1.commit()
+    conn1.close()
 
-    # Create temp database file
-    fd, db_path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
-
-    try:
-        # Initialize schema
-        schema_path = Path(__file__).parent.parent.parent / "memogarden" / "schema" / "schema.sql"
-        with sqlite3.connect(db_path) as init_conn:
-            init_conn.row_factory = sqlite3.Row
-            with open(schema_path, "r") as f:
-                init_conn.executescript(f.read())
-            init_conn.commit()
-
-        # Create initial entity
-        conn1 = sqlite3.connect(db_path)
-        conn1.row_factory = sqlite3.Row
-        conn1.execute("PRAGMA foreign_keys = ON")
-        core1 = Core(conn1, atomic=True)
-        entity_id_1 = core1.entity.create("transactions")
-        conn1.commit()
-        conn1.close()
-
-        # Use context manager for transaction
-        conn2 = sqlite3.connect(db_path)
-        conn2.row_factory = sqlite3.Row
-        conn2.execute("PRAGMA foreign_keys = ON")
-        with Core(conn2, atomic=True) as tx_core:
-            entity_id_2 = tx_core.entity.create("transactions")
-        # Connection closed on exit
+    # Use context manager for transaction
+    conn2 = _connect(schema_db_path)
+    with Core(conn2, atomic=True) as tx_core:
+        entity_id_2 = tx_core.entity.create("transactions")
+    # Connection closed on exit
 
-        # Verify both entities exist (committed) using fresh connection
-        conn3 = sqlite3.connect(db_path)
-        conn3.row_factory = sqlite3.Row
-        rows = conn3.execute("SELECT * FROM entity").fetchall()
-        conn3.close()
+    # Verify both entities exist (committed) using fresh connection
+    conn3 = _connect(schema_db_path)
+    rows = conn3.execute("SELECT * FROM entity").fetchall()
+    conn3.close()
 
-        assert len(rows) == 2
-    finally:
-        # Cleanup
-        os.unlink(db_path)
+    assert len(rows) == 2
 
 
-def test_core_atomic_context_manager_rolls_back_on_exception():
+def test_core_atomic_context_manager_rolls_back_on_exception(schema_db_path):
     """Core context manager should rollback on exception."""
-    import tempfile
-    import os
+    # Create initial entity
+    conn1 = _connect(schema_db_path)
+    core1 = Core(conn1, atomic=True)
+    entity_id = core1.entity.create("transactions")
+    conn1.commit()
+    conn1.close()
+
+    # Get initial count
+    conn_check = _connect(schema_db_path)
+    initial_count = len(conn_check.execute("SELECT * FROM entity").fetchall())
+    conn_check.close()
+
+    # Try to create entity but raise exception
+    conn2 = _connect(schema_db_path)
+    try:
+        with Core(conn2, atomic=True) as tx_core:
+            tx_core.entity.create("transactions")
+            raise ValueError("Test exception")
+    except ValueError:
+        pass  # Expected
 
-    # Create temp database file
-    fd, db_path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
+    # Verify count unchanged (rolled back)
+    conn3 = _connect(schema_db_path)
+    final_count = len(conn3.execute("SELECT * FROM entity").fetchall())
+    conn3.close()
 
-    try:
-        # Initialize schema
-        schema_path = Path(__file__).parent.parent.parent / "memogarden" / "schema" / "schema.sql"
-        with sqlite3.connect(db_path) as init_conn:
-            init_conn.row_factory = sqlite3.Row
-            with open(schema_path, "r") as f:
-                init_conn.executescript(f.read())
-            init_conn.commit()
-
-        # Create initial entity
-        conn1 = sqlite3.connect(db_path)
-        conn1.row_factory = sqlite3.Row
-        conn1.execute("PRAGMA foreign_keys = ON")
-        core1 = Core(conn1, atomic=True)
-        entity_id = core1.entity.create("transactions")
-        conn1.commit()
-        conn1.close()
-
-        # Get initial count
-        conn_check = sqlite3.connect(db_path)
-        conn_check.row_factory = sqlite3.Row
-        initial_count = len(conn_check.execute("SELECT * FROM entity").fetchall())
-        conn_check.close()
-
-        # Try to create entity but raise exception
-        conn2 = sqlite3.connect(db_path)
-        conn2.row_factory = sqlite3.Row
-        conn2.execute("PRAGMA foreign_keys = ON")
-        try:
-            with Core(conn2, atomic=True) as tx_core:
-                tx_core.entity.create("transactions")
-                raise ValueError("Test exception")
-        except ValueError:
-            pass  # Expected
-
-        # Verify count unchanged (rolled back)
-        conn3 = sqlite3.connect(db_path)
-        conn3.row_factory = sqlite3.Row
-        final_count = len(conn3.execute("SELECT * FROM entity").fetchall())
-        conn3.close()
-
-        assert final_count == initial_count
-    finally:
-        # Cleanup
-        os.unlink(db_path)
+    assert final_count == initial_count
 
 
 def test_core_atomic_context_manager_closes_connection(test_db):
@@ -281,103 +244,60 @@ def test_core_autocommit_single_operation():
     assert hasattr(core, 'transaction')
 
 
-def test_core_atomic_multi_operation_transaction():
+def test_core_atomic_multi_operation_transaction(schema_db_path):
     """Core with atomic=True should commit multiple operations together."""
-    import tempfile
-    import os
+    entity_id_1 = None
+    entity_id_2 = None
 
-    # Create temp database file
-    fd, db_path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
+    conn = _connect(schema_db_path)
 
-    try:
-        # Initialize schema
-        schema_path = Path(__file__).parent.parent.parent / "memogarden" / "schema" / "schema.sql"
-        with sqlite3.connect(db_path) as init_conn:
-            init_conn.row_factory = sqlite3.Row
-            with open(schema_path, "r") as f:
-                init_conn.executescript(f.read())
-            init_conn.commit()
+    with Core(conn, atomic=True) as core:
+        # Create first entity
+        entity_id_1 = core.entity.create("transactions")
 
-        entity_id_1 = None
-        entity_id_2 = None
+        # Create second entity
+        entity_id_2 = core.entity.create("transactions")
 
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON")
+        # Both should be created in same transaction
 
-        with Core(conn, atomic=True) as core:
-            # Create first entity
-            entity_id_1 = core.entity.create("transactions")
+    # Verify both entities exist after commit (using new connection)
+    conn2 = _connect(schema_db_path)
+    rows = conn2.execute("SELECT * FROM entity").fetchall()
+    ids = [row['id'] for row in rows]
+    conn2.close()
 
-            # Create second entity
-            entity_id_2 = core.entity.create("transactions")
+    assert entity_id_1 in ids
+    assert entity_id_2 in ids
 
-            # Both should be created in same transaction
 
-        # Verify both entities exist after commit (using new connection)
-        conn2 = sqlite3.connect(db_path)
-        conn2.row_factory = sqlite3.Row
-        rows = conn2.execute("SELECT * FROM entity").fetchall()
-        ids = [row['id'] for row in rows]
-        conn2.close()
-
-        assert entity_id_1 in ids
-        assert entity_id_2 in ids
-    finally:
-        os.unlink(db_path)
-
-
-def test_core_atomic_transaction_rolls_back_all_on_error():
+def test_core_atomic_transaction_rolls_back_all_on_error(schema_db_path):
     """Core with atomic=True should rollback all operations on error."""
-    import tempfile
-    import os
+    # Get initial count
+    conn_check = _connect(schema_db_path)
+    initial_count = len(conn_check.execute("SELECT * FROM entity").fetchall())
+    conn_check.close()
 
-    # Create temp database file
-    fd, db_path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
+    conn = _connect(schema_db_path)
 
     try:
-        # Initialize schema
-        schema_path = Path(__file__).parent.parent.parent / "memogarden" / "schema" / "schema.sql"
-        with sqlite3.connect(db_path) as init_conn:
-            init_conn.row_factory = sqlite3.Row
-            with open(schema_path, "r") as f:
-                init_conn.executescript(f.read())
-            init_conn.commit()
-
-        # Get initial count
-        conn_check = sqlite3.connect(db_path)
-        conn_check.row_factory = sqlite3.Row
-        initial_count = len(conn_check.execute("SELECT * FROM entity").fetchall())
-        conn_check.close()
-
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON")
-
-        try:
-            with Core(conn, atomic=True) as core:
-                # Create entity
-                core.entity.create("transactions")
-
-                # Create another entity
-                core.entity.create("transactions")
-
-                # Raise exception to trigger rollback
-                raise RuntimeError("Intentional error")
-        except RuntimeError:
-            pass
+        with Core(conn, atomic=True) as core:
+            # Create entity
+            core.entity.create("transactions")
 
-        # Verify no entities were created (all rolled back)
-        conn2 = sqlite3.connect(db_path)
-        conn2.row_factory = sqlite3.Row
-        final_count = len(conn2.execute("SELECT * FROM entity").fetchall())
-        conn2.close()
+            # Create another entity
+            core.entity.create("transactions")
 
-        assert final_count == initial_count
-    finally:
-        os.unlink(db_path)
+            # Raise exception to trigger rollback
+            raise RuntimeError("Intentional error")
+    except RuntimeError:
+        pass
+
+    # Verify no entities were created (all rolled back)
+    conn2 = _connect(schema_db_path)
+    final_count = len(conn2.execute("SELECT * FROM entity").fetchall())
+    conn2.close()
+
+    assert final_count == initial_count
 
 
 # ============================================================================
@@ -396,41 +316,21 @@ def test_core_entity_create_generates_uuid(test_db):
     assert entity_id.count("-") == 4
 
 
-def test_core_entity_get_by_id_returns_entity():
+def test_core_entity_get_by_id_returns_entity(schema_db_path):
     """core.entity.get_by_id() should return entity row."""
-    import tempfile
-    import os
+    # Create entity
+    conn1 = _connect(schema_db_path)
+    with Core(conn1, atomic=True) as core:
+        entity_id = core.entity.create("transactions")
 
-    fd, db_path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
+    # Get the entity with fresh connection
+    conn2 = _connect(schema_db_path)
+    core2 = Core(conn2, atomic=False)
+    row = core2.entity.get_by_id(entity_id)
 
-    try:
-        # Initialize schema
-        schema_path = Path(__file__).parent.parent.parent / "memogarden" / "schema" / "schema.sql"
-        with sqlite3.connect(db_path) as init_conn:
-            init_conn.row_factory = sqlite3.Row
-            with open(schema_path, "r") as f:
-                init_conn.executescript(f.read())
-            init_conn.commit()
-
-        # Create entity
-        conn1 = sqlite3.connect(db_path)
-        conn1.row_factory = sqlite3.Row
-        conn1.execute("PRAGMA foreign_keys = ON")
-        with Core(conn1, atomic=True) as core:
-            entity_id = core.entity.create("transactions")
-
-        # Get the entity with fresh connection
-        conn2 = sqlite3.connect(db_path)
-        conn2.row_factory = sqlite3.Row
-        core2 = Core(conn2, atomic=False)
-        row = core2.entity.get_by_id(entity_id)
-
-        assert row is not None
-        assert row['id'] == entity_id
-        assert row['type'] == 'transactions'
-    finally:
-        os.unlink(db_path)
+    assert row is not None
+    assert row['id'] == entity_id
+    assert row['type'] == 'transactions'
 
 
 def test_core_entity_get_by_id_raises_not_found(test_db):
@@ -444,93 +344,53 @@ def test_core_entity_get_by_id_raises_not_found(test_db):
 # TransactionOperations integration tests via Core
 # ============================================================================
 
-def test_core_transaction_create():
+def test_core_transaction_create(schema_db_path):
     """core.transaction.create() should create transaction with automatic entity creation."""
-    import tempfile
-    import os
-
-    fd, db_path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
-
-    try:
-        # Initialize schema
-        schema_path = Path(__file__).parent.parent.parent / "memogarden" / "schema" / "schema.sql"
-        with sqlite3.connect(db_path) as init_conn:
-            init_conn.row_factory = sqlite3.Row
-            with open(schema_path, "r") as f:
-                init_conn.executescript(f.read())
-            init_conn.commit()
-
-        entity_id = None
-        conn1 = sqlite3.connect(db_path)
-        conn1.row_factory = sqlite3.Row
-        conn1.execute("PRAGMA foreign_keys = ON")
-        with Core(conn1, atomic=True) as core:
-            # Create transaction - entity created automatically
-            entity_id = core.transaction.create(
-                amount=100.50,
-                transaction_date=date.today(),
-                description="Test transaction",
-                account="Test Account"
-            )
-
-        # Verify transaction was created (using fresh connection)
-        conn2 = sqlite3.connect(db_path)
-        conn2.row_factory = sqlite3.Row
-        row = conn2.execute("SELECT * FROM transactions WHERE id = ?", (entity_id,)).fetchone()
-
-        assert row is not None
-        assert row['amount'] == 100.50
-        assert row['description'] == "Test transaction"
-
-        # Verify entity was also created
-        entity_row = conn2.execute("SELECT * FROM entity WHERE id = ?", (entity_id,)).fetchone()
-        assert entity_row is not None
-        assert entity_row['type'] == 'transactions'
-    finally:
-        os.unlink(db_path)
-
-
-def test_core_transaction_get_by_id():
+    entity_id = None
+    conn1 = _connect(schema_db_path)
+    with Core(conn1, atomic=True) as core:
+        # Create transaction - entity created automatically
+        entity_id = core.transaction.create(
+            amount=100.50,
+            transaction_date=date.today(),
+            description="Test transaction",
+            account="Test Account"
+        )
+
+    # Verify transaction was created (using fresh connection)
+    conn2 = _connect(schema_db_path)
+    row = conn2.execute("SELECT * FROM transactions WHERE id = ?", (entity_id,)).fetchone()
+
+    assert row is not None
+    assert row['amount'] == 100.50
+    assert row['description'] == "Test transaction"
+
+    # Verify entity was also created
+    entity_row = conn2.execute("SELECT * FROM entity WHERE id = ?", (entity_id,)).fetchone()
+    assert entity_row is not None
+    assert entity_row['type'] == 'transactions'
+
+
+def test_core_transaction_get_by_id(schema_db_path):
     """core.transaction.get_by_id() should return transaction."""
-    import tempfile
-    import os
-
-    fd, db_path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
-
-    try:
-        # Initialize schema
-        schema_path = Path(__file__).parent.parent.parent / "memogarden" / "schema" / "schema.sql"
-        with sqlite3.connect(db_path) as init_conn:
-            init_conn.row_factory = sqlite3.Row
-            with open(schema_path, "r") as f:
-                init_conn.executescript(f.read())
-            init_conn.commit()
-
-        entity_id = None
-        conn1 = sqlite3.connect(db_path)
-        conn1.row_factory = sqlite3.Row
-        conn1.execute("PRAGMA foreign_keys = ON")
-        with Core(conn1, atomic=True) as core:
-            # Create transaction - entity created automatically
-            entity_id = core.transaction.create(
-                amount=50.00,
-                transaction_date=date.today(),
-                description="Test",
-                account="Account"
-            )
+    entity_id = None
+    conn1 = _connect(schema_db_path)
+    with Core(conn1, atomic=True) as core:
+        # Create transaction - entity created automatically
+        entity_id = core.transaction.create(
+            amount=50.00,
+            transaction_date=date.today(),
+            description="Test",
+            account="Account"
+        )
 
-        # Get transaction with fresh connection
-        conn2 = sqlite3.connect(db_path)
-        conn2.row_factory = sqlite3.Row
-        core2 = Core(conn2, atomic=False)
-        row = core2.transaction.get_by_id(entity_id)
+    # Get transaction with fresh connection
+    conn2 = _connect(schema_db_path)
+    core2 = Core(conn2, atomic=False)
+    row = core2.transaction.get_by_id(entity_id)
 
-        assert row is not None
-        assert row['amount'] == 50.00
-    finally:
-        os.unlink(db_path)
+    assert row is not None
+    assert row['amount'] == 50.00
 
 
 def test_core_transaction_get_by_id_raises_not_found(test_db):
@@ -540,45 +400,25 @@ def test_core_transaction_get_by_id_raises_not_found(test_db):
         core.transaction.get_by_id("99999999-9999-9999-9999-999999999999")
 
 
-def test_core_transaction_list():
+def test_core_transaction_list(schema_db_path):
     """core.transaction.list() should return list of transactions."""
-    import tempfile
-    import os
+    # Create multiple transactions
+    conn1 = _connect(schema_db_path)
+    with Core(conn1, atomic=True) as core:
+        for i in range(3):
+            core.transaction.create(
+                amount=float(10 + i * 10),
+                transaction_date=date.today(),
+                description=f"Transaction {i}",
+                account="Account"
+            )
 
-    fd, db_path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
+    # List transactions with fresh connection
+    conn2 = _connect(schema_db_path)
+    core2 = Core(conn2, atomic=False)
+    rows = core2.transaction.list({})
 
-    try:
-        # Initialize schema
-        schema_path = Path(__file__).parent.parent.parent / "memogarden" / "schema" / "schema.sql"
-        with sqlite3.connect(db_path) as init_conn:
-            init_conn.row_factory = sqlite3.Row
-            with open(schema_path, "r") as f:
-                init_conn.executescript(f.read())
-            init_conn.commit()
-
-        # Create multiple transactions
-        conn1 = sqlite3.connect(db_path)
-        conn1.row_factory = sqlite3.Row
-        conn1.execute("PRAGMA foreign_keys = ON")
-        with Core(conn1, atomic=True) as core:
-            for i in range(3):
-                core.transaction.create(
-                    amount=float(10 + i * 10),
-                    transaction_date=date.today(),
-                    description=f"Transaction {i}",
-                    account="Account"
-                )
-
-        # List transactions with fresh connection
-        conn2 = sqlite3.connect(db_path)
-        conn2.row_factory = sqlite3.Row
-        core2 = Core(conn2, atomic=False)
-        rows = core2.transaction.list({})
-
-        assert len(rows) == 3
-    finally:
-        os.unlink(db_path)
+    assert len(rows) == 3
 
 
 # ============================================================================
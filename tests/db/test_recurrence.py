@@ -12,7 +12,6 @@ from datetime import datetime
 
 from memogarden.db.recurrence import RecurrenceOperations
 from memogarden.db.entity import EntityOperations
-from memogarden.db import Core
 from memogarden.exceptions import ResourceNotFound
 
 
@@ -59,9 +58,8 @@ class TestRecurrenceGetById:
 class TestRecurrenceCreate:
     """Tests for RecurrenceOperations.create() method."""
 
-    def test_create_returns_uuid(self, test_db):
+    def test_create_returns_uuid(self, core):
         """create() should return UUID when using Core."""
-        core = Core(test_db)
         rrule = "FREQ=MONTHLY;BYDAY=2FR"
         entities = json.dumps([{"amount": -1500, "description": "Rent"}])
         valid_from = datetime(2025, 1, 1, 0, 0, 0)
@@ -75,9 +73,8 @@ class TestRecurrenceCreate:
         assert isinstance(recurrence_id, str)
         assert len(recurrence_id) == 36  # UUID v4 format
 
-    def test_create_creates_entity_entry(self, test_db):
+    def test_create_creates_entity_entry(self, core, test_db):
         """create() should create entity registry entry."""
-        core = Core(test_db)
         rrule = "FREQ=MONTHLY;BYDAY=2FR"
         entities = json.dumps([{"amount": -1500, "description": "Rent"}])
         valid_from = datetime(2025, 1, 1, 0, 0, 0)
@@ -96,9 +93,8 @@ class TestRecurrenceCreate:
         assert row is not None
         assert row["type"] == "recurrences"
 
-    def test_create_inserts_record(self, test_db):
+    def test_create_inserts_record(self, core, test_db):
         """create() should insert recurrence record."""
-        core = Core(test_db)
         rrule = "FREQ=MONTHLY;BYDAY=2FR"
         entities = json.dumps([{"amount": -1500, "description": "Rent"}])
         valid_from = datetime(2025, 1, 1, 0, 0, 0)
@@ -119,9 +115,8 @@ class TestRecurrenceCreate:
         assert row["entities"] == entities
         assert row["valid_from"] == "2025-01-01T00:00:00Z"
 
-    def test_create_with_valid_until(self, test_db):
+    def test_create_with_valid_until(self, core, test_db):
         """create() should handle valid_until field."""
-        core = Core(test_db)
         rrule = "FREQ=MONTHLY;BYDAY=2FR"
         entities = json.dumps([{"amount": -1500, "description": "Rent"}])
         valid_from = datetime(2025, 1, 1, 0, 0, 0)
@@ -181,9 +176,8 @@ class TestRecurrenceList:
 
         assert len(rows) == 2  # Feb and March
 
-    def test_list_excludes_superseded_by_default(self, test_db):
+    def test_list_excludes_superseded_by_default(self, core, test_db):
         """list() should exclude superseded recurrences by default."""
-        core = Core(test_db)
         entities = json.dumps([{"amount": -1500, "description": "Rent"}])
         valid_from = datetime(2025, 1, 1, 0, 0, 0)
 
@@ -200,9 +194,8 @@ class TestRecurrenceList:
 
         assert len(rows) == 1  # Only the non-superseded one
 
-    def test_list_includes_superseded_when_flag_set(self, test_db):
+    def test_list_includes_superseded_when_flag_set(self, core, test_db):
         """list() should include superseded recurrences when flag is set."""
-        core = Core(test_db)
         entities = json.dumps([{"amount": -1500, "description": "Rent"}])
         valid_from = datetime(2025, 1, 1, 0, 0, 0)
 
@@ -238,9 +231,8 @@ class TestRecurrenceList:
 class TestRecurrenceUpdate:
     """Tests for RecurrenceOperations.update() method."""
 
-    def test_update_updates_only_provided_fields(self, test_db):
+    def test_update_updates_only_provided_fields(self, core):
         """update() should only update provided fields."""
-        core = Core(test_db)
         entities = json.dumps([{"amount": -1500, "description": "Rent"}])
         valid_from = datetime(2025, 1, 1, 0, 0, 0)
 
@@ -253,9 +245,8 @@ class TestRecurrenceUpdate:
         assert row["rrule"] == "FREQ=WEEKLY"
         assert row["entities"] == entities  # Unchanged
 
-    def test_update_skips_none_values(self, test_db):
+    def test_update_skips_none_values(self, core):
         """update() should skip fields with None values (don't update)."""
-        core = Core(test_db)
         entities = json.dumps([{"amount": -1500, "description": "Rent"}])
         valid_from = datetime(2025, 1, 1, 0, 0, 0)
         valid_until = datetime(2025, 12, 31, 23, 59, 59)
@@ -274,9 +265,8 @@ class TestRecurrenceUpdate:
         # valid_until should remain unchanged (None values are skipped)
         assert row["valid_until"] == "2025-12-31T23:59:59Z"
 
-    def test_update_excludes_id_field(self, test_db):
+    def test_update_excludes_id_field(self, core):
         """update() should exclude id field from updates."""
-        core = Core(test_db)
         entities = json.dumps([{"amount": -1500, "description": "Rent"}])
         valid_from = datetime(2025, 1, 1, 0, 0, 0)
 
@@ -288,9 +278,8 @@ class TestRecurrenceUpdate:
         row = core.recurrence.get_by_id(recurrence_id)
         assert row["id"] == recurrence_id  # ID unchanged
 
-    def test_update_converts_datetime_to_string(self, test_db):
+    def test_update_converts_datetime_to_string(self, core):
         """update() should convert datetime fields to ISO strings."""
-        core = Core(test_db)
         entities = json.dumps([{"amount": -1500, "description": "Rent"}])
         valid_from = datetime(2025, 1, 1, 0, 0, 0)
 
@@ -303,9 +292,8 @@ class TestRecurrenceUpdate:
         row = core.recurrence.get_by_id(recurrence_id)
         assert row["valid_until"] == "2025-12-31T23:59:59Z"
 
-    def test_update_updates_entity_updated_at(self, test_db):
+    def test_update_updates_entity_updated_at(self, core):
         """update() should update entity.updated_at timestamp."""
-        core = Core(test_db)
         entities = json.dumps([{"amount": -1500, "description": "Rent"}])
         valid_from = datetime(2025, 1, 1, 0, 0, 0)
 
@@ -324,9 +312,8 @@ class TestRecurrenceUpdate:
 
         assert updated_at_after != updated_at_before
 
-    def test_update_with_empty_dict_does_nothing(self, test_db):
+    def test_update_with_empty_dict_does_nothing(self, core):
         """update() with empty dict shouldn't change anything."""
-        core = Core(test_db)
         entities = json.dumps([{"amount": -1500, "description": "Rent"}])
         valid_from = datetime(2025, 1, 1, 0, 0, 0)
 
@@ -353,9 +340,8 @@ class TestRecurrenceUpdate:
 class TestRecurrenceIntegration:
     """Integration tests for full recurrence lifecycle."""
 
-    def test_full_recurrence_lifecycle(self, test_db):
+    def test_full_recurrence_lifecycle(self, core):
         """Test create, read, update, delete lifecycle."""
-        core = Core(test_db)
         entities = json.dumps([{"amount": -1500, "description": "Rent"}])
         valid_from = datetime(2025, 1, 1, 0, 0, 0)
 
@@ -379,9 +365,8 @@ class TestRecurrenceIntegration:
         row = core.recurrence.get_by_id(recurrence_id)
         assert row["superseded_by"] == tombstone_id
 
-    def test_list_with_superseded_recurrences(self, test_db):
+    def test_list_with_superseded_recurrences(self, core):
         """Test that list correctly handles mix of active and superseded."""
-        core = Core(test_db)
         entities = json.dumps([{"amount": -1500, "description": "Rent"}])
         valid_from = datetime(2025, 1, 1, 0, 0, 0)
 
@@ -2,13 +2,40 @@
 
 import pytest
 from datetime import date
+from decimal import Decimal
 
 from memogarden.db.transaction import TransactionOperations
 from memogarden.db.entity import EntityOperations
-from memogarden.db import Core
 from memogarden.exceptions import ResourceNotFound
 
 
+def _fetch_transaction(db, transaction_id):
+    """Fetch the transaction columns these tests assert on, in one query."""
+    return db.execute(
+        """SELECT id, amount, currency, transaction_date, description,
+                  account, category, notes, author
+           FROM transactions WHERE id = ?""",
+        (transaction_id,)
+    ).fetchone()
+
+
+def _list_query_plan(db, core, filters):
+    """Run core.transaction.list(filters) and return its EXPLAIN QUERY PLAN details.
+
+    The SELECT is captured with a trace callback, which reports it with the
+    bound values expanded, so the plan is for exactly what list() executed.
+    """
+    statements = []
+    db.set_trace_callback(statements.append)
+    try:
+        core.transaction.list(filters)
+    finally:
+        db.set_trace_callback(None)
+
+    [select_sql] = [sql for sql in statements if sql.lstrip().startswith("SELECT")]
+    return [row["detail"] for row in db.execute(f"EXPLAIN QUERY PLAN {select_sql}")]
+
+
 class TestTransactionGetById:
     """Tests for TransactionOperations.get_by_id() method."""
 
@@ -81,9 +108,8 @@ class TestTransactionGetById:
 class TestTransactionCreate:
     """Tests for TransactionOperations.create() method."""
 
-    def test_create_inserts_transaction_with_correct_values(self, test_db):
+    def test_create_inserts_transaction_with_correct_values(self, core, test_db):
         """create() should insert transaction with correct values using Core API."""
-        core = Core(test_db, atomic=False)
         transaction_id = core.transaction.create(
             amount=123.45,
             transaction_date=date(2025, 12, 23),
@@ -94,10 +120,7 @@ class TestTransactionCreate:
         )
 
         # Verify in database
-        row = test_db.execute(
-            "SELECT * FROM transactions WHERE id = ?",
-            (transaction_id,)
-        ).fetchone()
+        row = _fetch_transaction(test_db, transaction_id)
 
         assert row["id"] == transaction_id
         assert row["amount"] == 123.45
@@ -109,9 +132,8 @@ class TestTransactionCreate:
         assert row["notes"] == "Weekly groceries"
         assert row["author"] == "system"
 
-    def test_create_with_optional_params_none(self, test_db):
+    def test_create_with_optional_params_none(self, core, test_db):
         """create() should handle None values for optional params."""
-        core = Core(test_db, atomic=False)
         transaction_id = core.transaction.create(
             amount=75.0,
             transaction_date=date(2025, 12, 23),
@@ -121,17 +143,13 @@ class TestTransactionCreate:
             notes=None
         )
 
-        row = test_db.execute(
-            "SELECT * FROM transactions WHERE id = ?",
-            (transaction_id,)
-        ).fetchone()
+        row = _fetch_transaction(test_db, transaction_id)
 
         assert row["category"] is None
         assert row["notes"] is None
 
-    def test_create_with_custom_author(self, test_db):
+    def test_create_with_custom_author(self, core, test_db):
         """create() should use custom author when provided."""
-        core = Core(test_db, atomic=False)
         transaction_id = core.transaction.create(
             amount=100.0,
             transaction_date=date(2025, 12, 23),
@@ -140,16 +158,12 @@ class TestTransactionCreate:
             author="user@example.com"
         )
 
-        row = test_db.execute(
-            "SELECT * FROM transactions WHERE id = ?",
-            (transaction_id,)
-        ).fetchone()
+        row = _fetch_transaction(test_db, transaction_id)
 
         assert row["author"] == "user@example.com"
 
-    def test_create_converts_date_to_string(self, test_db):
+    def test_create_converts_date_to_string(self, core, test_db):
         """create() should convert date to ISO 8601 date string."""
-        core = Core(test_db, atomic=False)
         test_date = date(2025, 6, 15)
 
         transaction_id = core.transaction.create(
@@ -159,13 +173,24 @@ class TestTransactionCreate:
             account="Personal"
         )
 
-        row = test_db.execute(
-            "SELECT transaction_date FROM transactions WHERE id = ?",
-            (transaction_id,)
-        ).fetchone()
+        row = _fetch_transaction(test_db, transaction_id)
 
         assert row["transaction_date"] == "2025-06-15"
 
+    def test_create_coerces_amount_to_float(self, core, test_db):
+        """create() should store non-float numeric amounts as floats."""
+        transaction_id = core.transaction.create(
+            amount=Decimal("12.50"),
+            transaction_date=date(2025, 6, 15),
+            description="Test",
+            account="Personal"
+        )
+
+        row = _fetch_transaction(test_db, transaction_id)
+
+        assert row["amount"] == 12.5
+        assert isinstance(row["amount"], float)
+
     def test_create_without_core_raises_value_error(self, test_db):
         """create() without Core reference should raise ValueError."""
         txn_ops = TransactionOperations(test_db, core=None)
@@ -178,10 +203,8 @@ class TestTransactionCreate:
                 account="Personal"
             )
 
-    def test_create_generates_unique_ids(self, test_db):
+    def test_create_generates_unique_ids(self, core, test_db):
         """create() should generate unique IDs for multiple transactions."""
-        core = Core(test_db, atomic=False)
-
         ids = []
         for i in range(5):
             txn_id = core.transaction.create(
@@ -197,16 +220,11 @@ class TestTransactionCreate:
 
         # All should exist in database
         for txn_id in ids:
-            row = test_db.execute(
-                "SELECT * FROM transactions WHERE id = ?",
-                (txn_id,)
-            ).fetchone()
+            row = _fetch_transaction(test_db, txn_id)
             assert row is not None
 
-    def test_create_also_creates_entity_registry_entry(self, test_db):
+    def test_create_also_creates_entity_registry_entry(self, core, test_db):
         """create() should also create entity registry entry."""
-        core = Core(test_db, atomic=False)
-
         transaction_id = core.transaction.create(
             amount=100.0,
             transaction_date=date(2025, 12, 23),
@@ -227,10 +245,8 @@ class TestTransactionCreate:
 class TestTransactionList:
     """Tests for TransactionOperations.list() method."""
 
-    def test_list_returns_all_transactions_no_filters(self, test_db):
+    def test_list_returns_all_transactions_no_filters(self, core):
         """list() should return all transactions when no filters provided."""
-        core = Core(test_db, atomic=False)
-
         # Create multiple transactions
         ids = []
         for i in range(3):
@@ -249,10 +265,8 @@ class TestTransactionList:
         # Should be ordered by date DESC, created_at DESC
         assert rows[0]["description"] == "Transaction 2"
 
-    def test_list_filters_by_account(self, test_db):
+    def test_list_filters_by_account(self, core):
         """list() should filter by account."""
-        core = Core(test_db, atomic=False)
-
         # Create transactions with different accounts
         core.transaction.create(
             amount=100.0,
@@ -274,10 +288,8 @@ class TestTransactionList:
         assert len(rows) == 1
         assert rows[0]["account"] == "Household"
 
-    def test_list_filters_by_category(self, test_db):
+    def test_list_filters_by_category(self, core):
         """list() should filter by category."""
-        core = Core(test_db, atomic=False)
-
         # Create transactions with different categories
         core.transaction.create(
             amount=20.0,
@@ -301,10 +313,8 @@ class TestTransactionList:
         assert len(rows) == 1
         assert rows[0]["category"] == "Food"
 
-    def test_list_filters_by_date_range(self, test_db):
+    def test_list_filters_by_date_range(self, core):
         """list() should filter by date range."""
-        core = Core(test_db, atomic=False)
-
         # Create transactions on different dates
         core.transaction.create(
             amount=50.0,
@@ -336,10 +346,8 @@ class TestTransactionList:
         assert len(rows) == 1
         assert rows[0]["description"] == "Middle"
 
-    def test_list_excludes_superseded_by_default(self, test_db):
+    def test_list_excludes_superseded_by_default(self, core):
         """list() should exclude superseded transactions by default."""
-        core = Core(test_db, atomic=False)
-
         # Create active transaction
         active_id = core.transaction.create(
             amount=100.0,
@@ -363,10 +371,8 @@ class TestTransactionList:
         assert len(rows) == 1
         assert rows[0]["id"] == active_id
 
-    def test_list_includes_superseded_when_flag_set(self, test_db):
+    def test_list_includes_superseded_when_flag_set(self, core):
         """list() should include superseded transactions when flag is True."""
-        core = Core(test_db, atomic=False)
-
         # Create transactions
         active_id = core.transaction.create(
             amount=100.0,
@@ -391,10 +397,51 @@ class TestTransactionList:
         assert active_id in ids
         assert old_id in ids
 
-    def test_list_with_limit_and_offset(self, test_db):
-        """list() should support limit and offset."""
-        core = Core(test_db, atomic=False)
+    def test_supersede_clears_is_active_flag(self, core, test_db):
+        """Superseding a transaction entity should clear transactions.is_active."""
+        active_id = core.transaction.create(
+            amount=100.0,
+            transaction_date=date(2025, 12, 23),
+            description="Active",
+            account="Personal"
+        )
 
+        old_id = core.transaction.create(
+            amount=50.0,
+            transaction_date=date(2025, 12, 23),
+            description="Old",
+            account="Personal"
+        )
+        core.entity.supersede(old_id, active_id)
+
+        rows = test_db.execute(
+            "SELECT id, is_active FROM transactions"
+        ).fetchall()
+
+        assert {row["id"]: row["is_active"] for row in rows} == {
+            active_id: 1,
+            old_id: 0,
+        }
+
+    def test_list_account_filter_uses_account_index(self, core, test_db):
+        """An account-filtered list() should search by the account index.
+
+        The default is_active predicate must not pull the planner onto the
+        low-selectivity active-rows index instead.
+        """
+        plan = _list_query_plan(test_db, core, {"account": "Personal"})
+
+        assert any("idx_transactions_account_date" in detail for detail in plan), plan
+        assert not any("idx_transactions_active_date" in detail for detail in plan), plan
+
+    def test_list_without_filters_uses_active_index(self, core, test_db):
+        """The default active-only list() should read the partial date index."""
+        plan = _list_query_plan(test_db, core, {})
+
+        assert any("idx_transactions_active_date" in detail for detail in plan), plan
+
+    def test_list_with_limit_and_offset(self, core):
+        """list() should support limit and offset."""
         # Create 5 transactions
         for i in range(5):
             core.transaction.create(
@@ -412,10 +459,8 @@ class TestTransactionList:
         rows = core.transaction.list({}, limit=2, offset=2)
         assert len(rows) == 2
 
-    def test_list_with_combined_filters(self, test_db):
+    def test_list_with_combined_filters(self, core):
         """list() should combine multiple filters correctly."""
-        core = Core(test_db, atomic=False)
-
         # Create various transactions
         core.transaction.create(
             amount=100.0,
@@ -454,10 +499,8 @@ class TestTransactionList:
 class TestTransactionUpdate:
     """Tests for TransactionOperations.update() method."""
 
-    def test_update_updates_only_provided_fields(self, test_db):
+    def test_update_updates_only_provided_fields(self, core, test_db):
         """update() should update only the fields provided."""
-        core = Core(test_db, atomic=False)
-
         transaction_id = core.transaction.create(
             amount=100.0,
             transaction_date=date(2025, 12, 23),
@@ -473,20 +516,15 @@ class TestTransactionUpdate:
         })
 
         # Verify
-        row = test_db.execute(
-            "SELECT * FROM transactions WHERE id = ?",
-            (transaction_id,)
-        ).fetchone()
+        row = _fetch_transaction(test_db, transaction_id)
 
         assert row["amount"] == 200.0
         assert row["description"] == "Updated"
         assert row["account"] == "Household"  # Unchanged
         assert row["category"] == "Food"  # Unchanged
 
-    def test_update_handles_none_values_correctly(self, test_db):
+    def test_update_handles_none_values_correctly(self, core, test_db):
         """update() should not update fields with None values."""
-        core = Core(test_db, atomic=False)
-
         transaction_id = core.transaction.create(
             amount=100.0,
             transaction_date=date(2025, 12, 23),
@@ -503,19 +541,14 @@ class TestTransactionUpdate:
             "notes": None
         })
 
-        row = test_db.execute(
-            "SELECT * FROM transactions WHERE id = ?",
-            (transaction_id,)
-        ).fetchone()
+        row = _fetch_transaction(test_db, transaction_id)
 
         assert row["amount"] == 150.0
         assert row["category"] == "Food"  # Unchanged (None not updated)
         assert row["notes"] == "Some notes"  # Unchanged
 
-    def test_update_excludes_id_field(self, test_db):
+    def test_update_excludes_id_field(self, core, test_db):
         """update() should exclude 'id' field from updates."""
-        core = Core(test_db, atomic=False)
-
         transaction_id = core.transaction.create(
             amount=100.0,
             transaction_date=date(2025, 12, 23),
@@ -530,17 +563,12 @@ class TestTransactionUpdate:
         })
 
         # ID should not change
-        row = test_db.execute(
-            "SELECT id FROM transactions WHERE id = ?",
-            (transaction_id,)
-        ).fetchone()
+        row = _fetch_transaction(test_db, transaction_id)
 
         assert row is not None  # Original ID still exists
 
-    def test_update_converts_date_to_string(self, test_db):
+    def test_update_converts_date_to_string(self, core, test_db):
         """update() should convert date to ISO 8601 date string."""
-        core = Core(test_db, atomic=False)
-
         transaction_id = core.transaction.create(
             amount=100.0,
             transaction_date=date(2025, 12, 23),
@@ -552,17 +580,12 @@ class TestTransactionUpdate:
         new_date = date(2025, 6, 15)
         core.transaction.update(transaction_id, {"transaction_date": new_date})
 
-        row = test_db.execute(
-            "SELECT transaction_date FROM transactions WHERE id = ?",
-            (transaction_id,)
-        ).fetchone()
+        row = _fetch_transaction(test_db, transaction_id)
 
         assert row["transaction_date"] == "2025-06-15"
 
-    def test_update_updates_entity_updated_at(self, test_db):
+    def test_update_updates_entity_updated_at(self, core, test_db):
         """update() should update entity.updated_at timestamp."""
-        core = Core(test_db, atomic=False)
-
         transaction_id = core.transaction.create(
             amount=100.0,
             transaction_date=date(2025, 12, 23),
@@ -592,10 +615,8 @@ class TestTransactionUpdate:
 
         assert updated_row["updated_at"] != original_updated_at
 
-    def test_update_with_empty_dict_does_nothing(self, test_db):
+    def test_update_with_empty_dict_does_nothing(self, core, test_db):
         """update() should do nothing when data dict is empty."""
-        core = Core(test_db, atomic=False)
-
         transaction_id = core.transaction.create(
             amount=100.0,
             transaction_date=date(2025, 12, 23),
@@ -603,32 +624,21 @@ class TestTransactionUpdate:
             account="Household"
         )
 
-        # Get original values
-        original_row = test_db.execute(
-            "SELECT * FROM transactions WHERE id = ?",
-            (transaction_id,)
-        ).fetchone()
-
         # Update with empty dict
         core.transaction.update(transaction_id, {})
 
-        # Verify nothing changed
-        updated_row = test_db.execute(
-            "SELECT * FROM transactions WHERE id = ?",
-            (transaction_id,)
-        ).fetchone()
+        # Verify nothing changed (compare against the values just created)
+        row = _fetch_transaction(test_db, transaction_id)
 
-        assert original_row["amount"] == updated_row["amount"]
-        assert original_row["description"] == updated_row["description"]
+        assert row["amount"] == 100.0
+        assert row["description"] == "Original"
 
 
 class TestTransactionIntegration:
     """Integration tests for TransactionOperations."""
 
-    def test_full_transaction_lifecycle(self, test_db):
+    def test_full_transaction_lifecycle(self, core):
         """Test complete lifecycle: create, get, list, update."""
-        core = Core(test_db, atomic=False)
-
         # Create
         transaction_id = core.transaction.create(
             amount=100.0,
@@ -651,10 +661,8 @@ class TestTransactionIntegration:
         row = core.transaction.get_by_id(transaction_id)
         assert row["amount"] == 200.0
 
-    def test_list_with_superseded_transactions(self, test_db):
+    def test_list_with_superseded_transactions(self, core):
         """Test listing with mix of active and superseded transactions."""
-        core = Core(test_db, atomic=False)
-
         # Create active transaction
         active_id = core.transaction.create(
             amount=100.0,
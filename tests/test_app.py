@@ -5,6 +5,12 @@ from memogarden.main import app
 from memogarden.config import settings
 
 
+@pytest.fixture(scope="session")
+def url_rules():
+    """Set of registered URL rule strings."""
+    return {rule.rule for rule in app.url_map.iter_rules()}
+
+
 class TestAppInitialization:
     """Test Flask application initialization."""
 
@@ -21,7 +27,7 @@ class TestAppInitialization:
         """App should have a name."""
         assert app.name is not None
 
-    def test_app_in_testing_mode_when_configured(self, client):
+    def test_app_in_testing_mode_when_configured(self, app_client):
         """App should respect TESTING configuration."""
         assert app.config['TESTING'] is True
 
@@ -29,16 +35,16 @@ class TestAppInitialization:
 class TestCORSConfiguration:
     """Test CORS middleware configuration."""
 
-    def test_cors_headers_present_on_health(self, client):
+    def test_cors_headers_present_on_health(self, app_client):
         """CORS headers should be present on API responses."""
-        response = client.get("/health")
+        response = app_client.get("/health")
 
         # Flask-CORS should add CORS headers
         assert "Access-Control-Allow-Origin" in response.headers
 
-    def test_cors_preflight_options_request(self, client):
+    def test_cors_preflight_options_request(self, app_client):
         """OPTIONS preflight request should be handled."""
-        response = client.options(
+        response = app_client.options(
             "/health",
             headers={
                 "Origin": "http://localhost:3000",
@@ -70,24 +76,30 @@ class TestLoggingConfiguration:
 class TestHealthEndpoint:
     """Test health check endpoint (app-level tests)."""
 
-    def test_health_route_registered(self):
+    def test_health_route_registered(self, url_rules):
         """Health route should be registered."""
-        rules = [rule.rule for rule in app.url_map.iter_rules()]
-        assert "/health" in rules
+        assert "/health" in url_rules
 
-    def test_health_returns_200(self, client):
+    def test_health_returns_200(self, app_client):
         """Health endpoint should return 200 status."""
-        response = client.get("/health")
+        response = app_client.get("/health")
         assert response.status_code == 200
 
-    def test_health_returns_json(self, client):
+    def test_health_returns_json(self, app_client):
         """Health endpoint should return JSON."""
-        response = client.get("/health")
+        response = app_client.get("/health")
         data = response.get_json()
         assert isinstance(data, dict)
 
-    def test_health_returns_status_ok(self, client):
+    def test_health_returns_status_ok(self, app_client):
         """Health endpoint should return status ok."""
-        response = client.get("/health")
+        response = app_client.get("/health")
         data = response.get_json()
         assert data["status"] == "ok"
+
+    def test_session_client_leaves_no_request_context(self, app_client):
+        """The shared client must not leave its request context pushed."""
+        from flask import has_request_context
+
+        app_client.get("/health")
+        assert not has_request_context()
@@ -1,89 +1,128 @@
 """Tests for database initialization and entity management."""
 
 import pytest
-import re
-from uuid import UUID
+import sqlite3
 from datetime import datetime
-from memogarden.db import get_core
+from pathlib import Path
+
+from memogarden.utils import isodatetime, secret
+
+
+# Table-valued PRAGMA functions take the table name as a bound parameter, so
+# one SQL string (and one cached prepared statement) serves every table.
+TABLE_INFO_SQL = "SELECT name, type FROM pragma_table_info(?)"
+# One row per (index, column); UNIQUE constraints show up as sqlite_autoindex_*
+INDEX_COLUMNS_SQL = (
+    'SELECT il.name, il."unique", ii.name FROM pragma_index_list(?) AS il '
+    'JOIN pragma_index_info(il.name) AS ii'
+)
+FOREIGN_KEY_LIST_SQL = 'SELECT "table", "from", "to" FROM pragma_foreign_key_list(?)'
+
+VERSION_SQL = "SELECT value FROM _schema_metadata WHERE key = 'version'"
+API_KEY_COUNT_SQL = "SELECT COUNT(*) FROM api_keys WHERE id = ?"
+
+# Frozen copy of schema.sql at version 20251230, the last release before the
+# transactions table rebuild; migration tests start from it.
+SCHEMA_20251230_SQL = (Path(__file__).parent / "fixtures" / "schema_20251230.sql").read_text()
+
+_UUID_CHARS = frozenset("0123456789abcdef-")
+
+
+def _is_uuid(value):
+    """True for a canonical lowercase UUID string, as produced by str(uuid4())."""
+    return (
+        len(value) == 36
+        and value[8] == value[13] == value[18] == value[23] == '-'
+        and value.count('-') == 4
+        and _UUID_CHARS.issuperset(value)
+    )
+
+
+def _is_utc_timestamp(value):
+    """True for an ISO 8601 datetime with 'Z' suffix, as isodatetime.now() emits.
+
+    fromisoformat() accepts the 'Z' suffix directly (Python 3.11+), rejects
+    malformed strings (raising ValueError), and parses a bare date without
+    tzinfo, so no separate regex is needed.
+    """
+    parsed = datetime.fromisoformat(value)
+    return value.endswith('Z') and parsed.tzinfo is not None
+
+
+def _is_iso_z(value):
+    """Cheap shape check for a 'YYYY-MM-DDTHH:MM:SS[.ffffff]Z' timestamp.
+
+    Only checks separator positions; _is_utc_timestamp() is the strict check.
+    """
+    return (
+        len(value) >= 20 and value[-1] == 'Z'
+        and value[4] == '-' and value[7] == '-' and value[10] == 'T'
+        and value[13] == ':' and value[16] == ':'
+    )
+
+
+@pytest.fixture(scope="module")
+def schema_snapshot(schema_template):
+    """Names of all schema objects, grouped by type, from one sqlite_master scan."""
+    snapshot = {"table": set(), "index": set(), "view": set(), "trigger": set()}
+    for obj_type, name in schema_template.execute(
+        "SELECT type, name FROM sqlite_master"
+    ):
+        snapshot[obj_type].add(name)
+    return snapshot
 
 
 class TestSchemaInitialization:
-    """Test database schema creation."""
+    """Test database schema creation.
 
-    def test_tables_created(self, test_db):
+    These checks only read sqlite_master/_schema_metadata, so they inspect the
+    session-wide schema_template directly instead of a per-test copy.
+    """
+
+    def test_tables_created(self, schema_snapshot):
         """Verify all expected tables are created."""
-        cursor = test_db.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name"
-        )
-        tables = [row[0] for row in cursor.fetchall()]
+        expected = {"_schema_metadata", "api_keys", "entity", "transactions", "users"}
 
-        assert "_schema_metadata" in tables
-        assert "api_keys" in tables
-        assert "entity" in tables
-        assert "transactions" in tables
-        assert "users" in tables
+        assert expected <= schema_snapshot["table"]
 
-    def test_indices_created(self, test_db):
+    def test_indices_created(self, schema_snapshot):
         """Verify indices are created."""
-        cursor = test_db.execute(
-            "SELECT name FROM sqlite_master WHERE type='index' ORDER BY name"
-        )
-        indices = [row[0] for row in cursor.fetchall()]
+        indices = schema_snapshot["index"]
 
         # Check key indices exist
         assert any("entity_type" in idx for idx in indices)
         assert any("transactions_date" in idx for idx in indices)
         assert any("transactions_account" in idx for idx in indices)
 
-    def test_view_created(self, test_db):
+    def test_view_created(self, schema_snapshot):
         """Verify transactions_view is created."""
-        cursor = test_db.execute(
-            "SELECT name FROM sqlite_master WHERE type='view'"
-        )
-        views = [row[0] for row in cursor.fetchall()]
+        assert "transactions_view" in schema_snapshot["view"]
 
-        assert "transactions_view" in views
+    def test_schema_version(self, schema_template):
+        """schema.sql should stamp the version the code expects."""
+        from memogarden.db import EXPECTED_SCHEMA_VERSION
 
-    def test_schema_version(self, test_db):
-        """Verify schema version is set correctly (or migrated)."""
-        cursor = test_db.execute(
-            "SELECT value FROM _schema_metadata WHERE key = 'version'"
-        )
-        row = cursor.fetchone()
+        # The one query that ties schema.sql to the Python constant; other
+        # tests compare against EXPECTED_SCHEMA_VERSION directly.
+        row = schema_template.execute(VERSION_SQL).fetchone()
 
         assert row is not None
-        # Accept current schema version or newer (forward compatible)
-        # Note: This test is flexible to accommodate different schema versions
-        # during development and migration periods
-        version = row[0]
-        # Should be a valid version string (YYYYMMDD format)
-        assert len(version) == 8
-        assert version.isdigit()
+        assert row[0] == EXPECTED_SCHEMA_VERSION
 
 
 class TestEntityCreation:
     """Test entity creation and management."""
 
-    def test_create_entity_returns_uuid(self, test_db):
+    def test_create_entity_returns_uuid(self, core):
         """create_entity should return a valid UUID string."""
-        core = get_core()
-        core._conn = test_db  # Use test connection
         entity_id = core.entity.create("transactions")
 
-        # Should be a valid UUID
-        try:
-            UUID(entity_id)
-            is_valid_uuid = True
-        except ValueError:
-            is_valid_uuid = False
-
-        assert is_valid_uuid
+        # Should be a valid UUID string
         assert isinstance(entity_id, str)
+        assert _is_uuid(entity_id)
 
-    def test_create_entity_inserts_record(self, test_db):
+    def test_create_entity_inserts_record(self, core, test_db):
         """create_entity should insert record into entity table."""
-        core = get_core()
-        core._conn = test_db  # Use test connection
         entity_id = core.entity.create("transactions")
 
         cursor = test_db.execute(
@@ -96,10 +135,8 @@ class TestEntityCreation:
         assert row[0] == entity_id
         assert row[1] == "transactions"
 
-    def test_create_entity_sets_timestamps(self, test_db):
+    def test_create_entity_sets_timestamps(self, core, test_db):
         """create_entity should set created_at and updated_at."""
-        core = get_core()
-        core._conn = test_db  # Use test connection
         entity_id = core.entity.create("transactions")
 
         cursor = test_db.execute(
@@ -113,22 +150,15 @@ class TestEntityCreation:
         updated_at = row[1]
 
         # Should be ISO 8601 format with Z suffix
-        iso_pattern = r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?Z$'
-        assert re.match(iso_pattern, created_at)
-        assert re.match(iso_pattern, updated_at)
-
-        # Should be parseable as datetime
-        datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-        datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
+        assert _is_utc_timestamp(created_at)
+        assert _is_utc_timestamp(updated_at)
 
 
 class TestEntityLookup:
     """Test entity type lookup (behavior test via Core API)."""
 
-    def test_get_entity_returns_correct_type(self, test_db):
+    def test_get_entity_returns_correct_type(self, core):
         """get_by_id should return correct type for existing entity."""
-        core = get_core()
-        core._conn = test_db  # Use test connection
         entity_id = core.entity.create("transactions")
 
         row = core.entity.get_by_id(entity_id)
@@ -140,15 +170,12 @@ class TestEntityLookup:
 class TestEntitySupersession:
     """Test entity supersession."""
 
-    def test_supersede_entity_sets_fields(self, test_db):
+    def test_supersede_entity_sets_fields(self, core, test_db):
         """supersede should set superseded_by and superseded_at."""
-        core = get_core()
-        core._conn = test_db  # Use test connection
         old_id = core.entity.create("transactions")
         new_id = core.entity.create("transactions")
 
         core.entity.supersede(old_id, new_id)
-        test_db.commit()
 
         cursor = test_db.execute(
             "SELECT superseded_by, superseded_at FROM entity WHERE id = ?",
@@ -161,43 +188,71 @@ class TestEntitySupersession:
         assert row[1] is not None  # superseded_at
 
         # Verify timestamp format
-        iso_pattern = r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?Z$'
-        assert re.match(iso_pattern, row[1])
+        assert _is_iso_z(row[1])
 
-    def test_supersede_entity_updates_timestamp(self, test_db):
+    def test_supersede_entity_updates_timestamp(self, core, test_db):
         """supersede should update the updated_at timestamp."""
-        core = get_core()
-        core._conn = test_db  # Use test connection
         old_id = core.entity.create("transactions")
 
-        # Get original updated_at
-        cursor = test_db.execute(
-            "SELECT updated_at FROM entity WHERE id = ?",
-            (old_id,)
+        # Backdate updated_at so the change is observable without relying
+        # on the wall clock advancing between calls
+        original_updated = "2000-01-01T00:00:00Z"
+        test_db.execute(
+            "UPDATE entity SET updated_at = ? WHERE id = ?",
+            (original_updated, old_id)
         )
-        original_updated = cursor.fetchone()[0]
 
         # Supersede
         new_id = core.entity.create("transactions")
         core.entity.supersede(old_id, new_id)
-        test_db.commit()
 
-        # Check updated_at changed
-        cursor = test_db.execute(
-            "SELECT updated_at FROM entity WHERE id = ?",
+        # Check updated_at changed, in the same read as superseded_at
+        row = test_db.execute(
+            "SELECT updated_at, superseded_at FROM entity WHERE id = ?",
             (old_id,)
-        )
-        new_updated = cursor.fetchone()[0]
+        ).fetchone()
+
+        assert row["updated_at"] != original_updated
+        assert _is_iso_z(row["updated_at"])
+        # supersede() stamps both columns with the same instant
+        assert row["updated_at"] == row["superseded_at"]
+
+
+def _insert_transactions(db, rows):
+    """Insert (amount, description) transactions with their entity entries.
+
+    Entity and transaction rows are each written with one executemany().
+
+    Returns:
+        List of the new transaction IDs, in input order
+    """
+    ids = [secret.generate_uuid() for _ in rows]
+    now = isodatetime.now()
 
-        # Timestamps should be different (though might be same if very fast)
-        # At minimum, should still be valid ISO format
-        iso_pattern = r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?Z$'
-        assert re.match(iso_pattern, new_updated)
+    db.executemany(
+        "INSERT INTO entity (id, type, created_at, updated_at) VALUES (?, ?, ?, ?)",
+        [(entity_id, "transactions", now, now) for entity_id in ids]
+    )
+    db.executemany(
+        """INSERT INTO transactions
+           (id, amount, currency, transaction_date, description, account, author)
+           VALUES (?, ?, ?, ?, ?, ?, ?)""",
+        [
+            (entity_id, amount, "SGD", "2025-12-22", description, "Personal", "user")
+            for entity_id, (amount, description) in zip(ids, rows)
+        ]
+    )
+
+    return ids
 
 
 class TestTransactionEntityIntegration:
     """Test that transactions work with entity registry."""
 
+    def test_foreign_keys_enforced(self, test_db):
+        """test_db should have foreign key enforcement on (FK tests rely on it)."""
+        assert test_db.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
     def test_transaction_requires_entity(self, test_db):
         """Transaction should require entity record (FK constraint)."""
         # Try to insert transaction without entity
@@ -208,21 +263,10 @@ class TestTransactionEntityIntegration:
                    VALUES (?, ?, ?, ?, ?, ?, ?)""",
                 ("fake-id", 10.0, "SGD", "2025-12-22", "Test", "Household", "test")
             )
-            test_db.commit()
 
     def test_transaction_with_entity_works(self, test_db):
         """Transaction should work when entity exists."""
-        core = get_core()
-        core._conn = test_db  # Use test connection
-        entity_id = core.entity.create("transactions")
-
-        test_db.execute(
-            """INSERT INTO transactions
-               (id, amount, currency, transaction_date, description, account, author)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            (entity_id, 10.0, "SGD", "2025-12-22", "Coffee", "Personal", "user")
-        )
-        test_db.commit()
+        [entity_id] = _insert_transactions(test_db, [(10.0, "Coffee")])
 
         # Verify transaction exists
         cursor = test_db.execute(
@@ -238,17 +282,7 @@ class TestTransactionEntityIntegration:
 
     def test_transactions_view_includes_metadata(self, test_db):
         """transactions_view should include entity metadata."""
-        core = get_core()
-        core._conn = test_db  # Use test connection
-        entity_id = core.entity.create("transactions")
-
-        test_db.execute(
-            """INSERT INTO transactions
-               (id, amount, currency, transaction_date, description, account, author)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            (entity_id, 10.0, "SGD", "2025-12-22", "Coffee", "Personal", "user")
-        )
-        test_db.commit()
+        [entity_id] = _insert_transactions(test_db, [(10.0, "Coffee")])
 
         # Query via view
         cursor = test_db.execute(
@@ -264,47 +298,50 @@ class TestTransactionEntityIntegration:
         assert row[3] is not None  # updated_at from entity
 
 
-class TestUsersTable:
-    """Test users table schema and constraints."""
+class TestTableStructure:
+    """Test columns and foreign keys of auth tables."""
 
-    def test_users_table_columns(self, test_db):
-        """Verify users table has correct columns."""
-        cursor = test_db.execute("PRAGMA table_info(users)")
-        columns = {row[1]: row[2] for row in cursor.fetchall()}
+    @pytest.mark.parametrize("table, expected_columns", [
+        ("users", {"id", "username", "password_hash", "is_admin", "created_at"}),
+        ("api_keys", {
+            "id", "user_id", "name", "key_hash", "key_prefix",
+            "expires_at", "created_at", "last_seen", "revoked_at",
+        }),
+    ])
+    def test_table_columns(self, schema_template, table, expected_columns):
+        """Verify table has the expected columns."""
+        cursor = schema_template.execute(TABLE_INFO_SQL, (table,))
+        columns = {row[0] for row in cursor}
 
-        assert "id" in columns
-        assert "username" in columns
-        assert "password_hash" in columns
-        assert "is_admin" in columns
-        assert "created_at" in columns
+        assert expected_columns <= columns
 
-    def test_users_username_unique(self, test_db):
-        """Verify username has unique constraint."""
-        cursor = test_db.execute("PRAGMA index_list(users)")
-        indexes = cursor.fetchall()
+    @pytest.mark.parametrize("table, expected_targets", [
+        ("users", {"entity"}),
+        ("api_keys", {"entity", "users"}),
+    ])
+    def test_table_foreign_keys(self, schema_template, table, expected_targets):
+        """Verify table has foreign keys to the expected tables."""
+        cursor = schema_template.execute(FOREIGN_KEY_LIST_SQL, (table,))
+        targets = {fk[0] for fk in cursor}
 
-        # Find unique index on username
-        username_idx = None
-        for idx in indexes:
-            if "username" in idx[1]:
-                username_idx = idx
-                break
+        assert expected_targets <= targets
 
-        assert username_idx is not None, "No unique index found on username"
 
-    def test_users_entity_foreign_key(self, test_db):
-        """Verify users table has foreign key to entity."""
-        cursor = test_db.execute("PRAGMA foreign_key_list(users)")
-        fks = cursor.fetchall()
+class TestUsersTable:
+    """Test users table schema and constraints."""
 
-        # Should have FK to entity table
-        entity_fk = [fk for fk in fks if fk[2] == "entity"]
-        assert len(entity_fk) > 0, "No foreign key to entity table found"
+    def test_users_username_unique(self, schema_template):
+        """Verify username has unique constraint."""
+        cursor = schema_template.execute(INDEX_COLUMNS_SQL, ("users",))
+
+        # Match on the indexed column and the unique flag, not the index name:
+        # idx_users_username is a plain lookup index, the constraint is an autoindex
+        assert any(
+            unique == 1 and column == "username" for _, unique, column in cursor
+        ), "No unique index found on username"
 
-    def test_users_with_entity_works(self, test_db):
+    def test_users_with_entity_works(self, core, test_db):
         """User should work when entity exists."""
-        core = get_core()
-        core._conn = test_db
         entity_id = core.entity.create("users")
 
         test_db.execute(
@@ -313,7 +350,6 @@ class TestUsersTable:
                VALUES (?, ?, ?, ?, ?)""",
             (entity_id, "testuser", "hashedpassword", 1, "2025-12-29T10:00:00Z")
         )
-        test_db.commit()
 
         cursor = test_db.execute(
             "SELECT id, username, is_admin FROM users WHERE id = ?",
@@ -335,68 +371,44 @@ class TestUsersTable:
                    VALUES (?, ?, ?, ?, ?)""",
                 ("fake-id", "testuser", "hashedpassword", 1, "2025-12-29T10:00:00Z")
             )
-            test_db.commit()
+
+
+def _insert_user_with_api_key(db):
+    """Insert a user and one API key, plus their entity rows.
+
+    Returns:
+        (user_id, api_key_id)
+    """
+    user_id = secret.generate_uuid()
+    api_key_id = secret.generate_uuid()
+    now = isodatetime.now()
+
+    db.executemany(
+        "INSERT INTO entity (id, type, created_at, updated_at) VALUES (?, ?, ?, ?)",
+        [(user_id, "users", now, now), (api_key_id, "api_keys", now, now)]
+    )
+    db.execute(
+        """INSERT INTO users
+           (id, username, password_hash, is_admin, created_at)
+           VALUES (?, ?, ?, ?, ?)""",
+        (user_id, "testuser", "hashedpassword", 1, "2025-12-29T10:00:00Z")
+    )
+    db.execute(
+        """INSERT INTO api_keys
+           (id, user_id, name, key_hash, key_prefix, created_at)
+           VALUES (?, ?, ?, ?, ?, ?)""",
+        (api_key_id, user_id, "test-key", "hash123", "mg_sk_test_", "2025-12-29T10:00:00Z")
+    )
+
+    return user_id, api_key_id
 
 
 class TestAPIKeysTable:
     """Test api_keys table schema and constraints."""
 
-    def test_api_keys_table_columns(self, test_db):
-        """Verify api_keys table has correct columns."""
-        cursor = test_db.execute("PRAGMA table_info(api_keys)")
-        columns = {row[1]: row[2] for row in cursor.fetchall()}
-
-        assert "id" in columns
-        assert "user_id" in columns
-        assert "name" in columns
-        assert "key_hash" in columns
-        assert "key_prefix" in columns
-        assert "expires_at" in columns
-        assert "created_at" in columns
-        assert "last_seen" in columns
-        assert "revoked_at" in columns
-
-    def test_api_keys_entity_foreign_key(self, test_db):
-        """Verify api_keys table has foreign key to entity."""
-        cursor = test_db.execute("PRAGMA foreign_key_list(api_keys)")
-        fks = cursor.fetchall()
-
-        # Should have FK to entity table
-        entity_fk = [fk for fk in fks if fk[2] == "entity"]
-        assert len(entity_fk) > 0, "No foreign key to entity table found"
-
-    def test_api_keys_user_foreign_key(self, test_db):
-        """Verify api_keys table has foreign key to users."""
-        cursor = test_db.execute("PRAGMA foreign_key_list(api_keys)")
-        fks = cursor.fetchall()
-
-        # Should have FK to users table
-        user_fk = [fk for fk in fks if fk[2] == "users"]
-        assert len(user_fk) > 0, "No foreign key to users table found"
-
     def test_api_keys_with_user_and_entity_works(self, test_db):
         """API key should work when entity and user exist."""
-        core = get_core()
-        core._conn = test_db
-
-        # Create user entity and user record
-        user_entity_id = core.entity.create("users")
-        test_db.execute(
-            """INSERT INTO users
-               (id, username, password_hash, is_admin, created_at)
-               VALUES (?, ?, ?, ?, ?)""",
-            (user_entity_id, "testuser", "hashedpassword", 1, "2025-12-29T10:00:00Z")
-        )
-
-        # Create API key entity and record
-        api_key_entity_id = core.entity.create("api_keys")
-        test_db.execute(
-            """INSERT INTO api_keys
-               (id, user_id, name, key_hash, key_prefix, created_at)
-               VALUES (?, ?, ?, ?, ?, ?)""",
-            (api_key_entity_id, user_entity_id, "test-key", "hash123", "mg_sk_test_", "2025-12-29T10:00:00Z")
-        )
-        test_db.commit()
+        user_entity_id, api_key_entity_id = _insert_user_with_api_key(test_db)
 
         cursor = test_db.execute(
             "SELECT id, user_id, name, key_prefix FROM api_keys WHERE id = ?",
@@ -410,10 +422,8 @@ class TestAPIKeysTable:
         assert row[2] == "test-key"
         assert row[3] == "mg_sk_test_"
 
-    def test_api_keys_requires_user(self, test_db):
+    def test_api_keys_requires_user(self, core, test_db):
         """API key should require user record (FK constraint)."""
-        core = get_core()
-        core._conn = test_db
         api_key_entity_id = core.entity.create("api_keys")
 
         with pytest.raises(Exception):  # sqlite3.IntegrityError
@@ -423,66 +433,38 @@ class TestAPIKeysTable:
                    VALUES (?, ?, ?, ?, ?, ?)""",
                 (api_key_entity_id, "fake-user-id", "test-key", "hash123", "mg_sk_test_", "2025-12-29T10:00:00Z")
             )
-            test_db.commit()
 
     def test_api_keys_cascades_on_user_delete(self, test_db):
         """API keys should be deleted when user is deleted (CASCADE)."""
-        core = get_core()
-        core._conn = test_db
-
-        # Create user entity and user record
-        user_entity_id = core.entity.create("users")
-        test_db.execute(
-            """INSERT INTO users
-               (id, username, password_hash, is_admin, created_at)
-               VALUES (?, ?, ?, ?, ?)""",
-            (user_entity_id, "testuser", "hashedpassword", 1, "2025-12-29T10:00:00Z")
-        )
-
-        # Create API key entity and record
-        api_key_entity_id = core.entity.create("api_keys")
-        test_db.execute(
-            """INSERT INTO api_keys
-               (id, user_id, name, key_hash, key_prefix, created_at)
-               VALUES (?, ?, ?, ?, ?, ?)""",
-            (api_key_entity_id, user_entity_id, "test-key", "hash123", "mg_sk_test_", "2025-12-29T10:00:00Z")
-        )
-        test_db.commit()
+        user_entity_id, api_key_entity_id = _insert_user_with_api_key(test_db)
 
         # Verify API key exists
-        cursor = test_db.execute(
-            "SELECT COUNT(*) FROM api_keys WHERE id = ?",
-            (api_key_entity_id,)
-        )
-        count_before = cursor.fetchone()[0]
-        assert count_before == 1
+        assert test_db.execute(API_KEY_COUNT_SQL, (api_key_entity_id,)).fetchone()[0] == 1
 
         # Delete user (should cascade to API keys)
         test_db.execute("DELETE FROM users WHERE id = ?", (user_entity_id,))
-        test_db.commit()
 
         # Verify API key is deleted
-        cursor = test_db.execute(
-            "SELECT COUNT(*) FROM api_keys WHERE id = ?",
-            (api_key_entity_id,)
-        )
-        count_after = cursor.fetchone()[0]
-        assert count_after == 0
+        assert test_db.execute(API_KEY_COUNT_SQL, (api_key_entity_id,)).fetchone()[0] == 0
 
 
 class TestMigration:
-    """Test database migration functionality."""
+    """Test database migration functionality.
+
+    Tests that rewrite _schema_metadata or apply migrations need their own
+    test_db copy; read-only checks use the shared schema_template.
+    """
 
-    def test_get_current_schema_version(self, test_db):
+    def test_get_current_schema_version(self, schema_template):
         """Test getting current schema version from database."""
         from memogarden.db import _get_current_schema_version
 
-        version = _get_current_schema_version(test_db)
+        version = _get_current_schema_version(schema_template)
         assert version is not None
         assert len(version) == 8
         assert version.isdigit()
 
-    def test_migration_needed_applies_migration(self, test_db, tmp_path):
+    def test_migration_needed_applies_migration(self, test_db):
         """Test that migration is applied when database is at old version."""
         from memogarden.db import _run_migrations, EXPECTED_SCHEMA_VERSION
 
@@ -494,38 +476,31 @@ class TestMigration:
         test_db.commit()
 
         # Verify old version
-        cursor = test_db.execute("SELECT value FROM _schema_metadata WHERE key = 'version'")
-        assert cursor.fetchone()[0] == "20251229"
+        assert test_db.execute(VERSION_SQL).fetchone()[0] == "20251229"
 
         # Run migrations
         _run_migrations(test_db)
 
         # Verify migration was applied
-        cursor = test_db.execute("SELECT value FROM _schema_metadata WHERE key = 'version'")
-        version = cursor.fetchone()[0]
-        assert version == EXPECTED_SCHEMA_VERSION
+        assert test_db.execute(VERSION_SQL).fetchone()[0] == EXPECTED_SCHEMA_VERSION
 
         # Verify new table exists
-        cursor = test_db.execute(
+        assert test_db.execute(
             "SELECT name FROM sqlite_master WHERE type='table' AND name = 'recurrences'"
-        )
-        tables = [row[0] for row in cursor.fetchall()]
-        assert "recurrences" in tables
+        ).fetchone() is not None
 
     def test_migration_not_needed_when_at_current_version(self, test_db):
         """Test that no migration occurs when already at current version."""
         from memogarden.db import _run_migrations, EXPECTED_SCHEMA_VERSION
 
         # Verify we're at expected version
-        cursor = test_db.execute("SELECT value FROM _schema_metadata WHERE key = 'version'")
-        initial_version = cursor.fetchone()[0]
+        initial_version = test_db.execute(VERSION_SQL).fetchone()[0]
 
         # Run migrations
         _run_migrations(test_db)
 
         # Version should be unchanged
-        cursor = test_db.execute("SELECT value FROM _schema_metadata WHERE key = 'version'")
-        assert cursor.fetchone()[0] == initial_version
+        assert test_db.execute(VERSION_SQL).fetchone()[0] == initial_version
 
     def test_migration_forward_compatible_with_newer_db(self, test_db):
         """Test that system is forward compatible with newer database versions."""
@@ -534,7 +509,7 @@ class TestMigration:
         # Simulate newer schema version
         test_db.execute(
             "UPDATE _schema_metadata SET value = ? WHERE key = 'version'",
-            ("20251230",)  # Future version
+            ("20991231",)  # Future version
         )
         test_db.commit()
 
@@ -542,5 +517,54 @@ class TestMigration:
         _run_migrations(test_db)
 
         # Version should still be the newer version
-        cursor = test_db.execute("SELECT value FROM _schema_metadata WHERE key = 'version'")
-        assert cursor.fetchone()[0] == "20251230"
+        assert test_db.execute(VERSION_SQL).fetchone()[0] == "20991231"
+
+    def test_migration_from_20251230_rebuilds_transactions(self):
+        """Migrating real 20251230 data should backfill is_active and keep FKs intact."""
+        from memogarden.db import _run_migrations, EXPECTED_SCHEMA_VERSION
+
+        db = sqlite3.connect(":memory:")
+        db.row_factory = sqlite3.Row
+        db.execute("PRAGMA foreign_keys = ON")
+        db.executescript(SCHEMA_20251230_SQL)
+
+        active_id, old_id, new_id = (secret.generate_uuid() for _ in range(3))
+        now = isodatetime.now()
+        db.executemany(
+            """INSERT INTO entity (id, type, superseded_by, superseded_at, created_at, updated_at)
+               VALUES (?, 'transactions', ?, ?, ?, ?)""",
+            [
+                (active_id, None, None, now, now),
+                (new_id, None, None, now, now),
+                (old_id, new_id, now, now, now),
+            ]
+        )
+        db.executemany(
+            """INSERT INTO transactions (id, amount, transaction_date, account)
+               VALUES (?, ?, '2025-12-22', 'Personal')""",
+            [(active_id, 10.0), (old_id, 20.0), (new_id, 25.0)]
+        )
+        db.commit()
+
+        _run_migrations(db)
+
+        assert db.execute(VERSION_SQL).fetchone()[0] == EXPECTED_SCHEMA_VERSION
+
+        # is_active backfilled from entity.superseded_by; no rows lost
+        is_active = dict(db.execute("SELECT id, is_active FROM transactions"))
+        assert is_active == {active_id: 1, old_id: 0, new_id: 1}
+
+        schema = {tuple(row) for row in db.execute("SELECT type, name FROM sqlite_master")}
+        assert ("trigger", "trg_entity_superseded_transactions") in schema
+        assert ("view", "transactions_view") in schema
+        assert ("index", "idx_transactions_active_date") in schema
+
+        assert db.execute("PRAGMA foreign_key_check").fetchall() == []
+
+        # The recreated view still joins entity metadata
+        row = db.execute(
+            "SELECT amount, superseded_by FROM transactions_view WHERE id = ?", (old_id,)
+        ).fetchone()
+        assert (row["amount"], row["superseded_by"]) == (20.0, new_id)
+
+        db.close()
@@ -11,9 +11,11 @@ from memogarden.exceptions import (
 )
 
 
-@pytest.fixture
-def error_app():
+def _build_error_app():
     """Create a test app with error testing routes."""
+    from memogarden.main import handle_not_found, handle_validation_error
+    from memogarden.main import handle_memo_garden_error, handle_internal_error
+
     test_app = Flask(__name__)
     test_app.config['TESTING'] = True
     # Disable trap so exceptions propagate to error handlers
@@ -21,13 +23,13 @@ def error_app():
     test_app.config['TRAP_BAD_REQUEST_ERRORS'] = True
 
     # Copy error handlers from main app
-    from memogarden.main import handle_not_found, handle_validation_error
-    from memogarden.main import handle_memo_garden_error, handle_internal_error
-
-    test_app.errorhandler(ResourceNotFound)(handle_not_found)
-    test_app.errorhandler(ValidationError)(handle_validation_error)
-    test_app.errorhandler(MemoGardenError)(handle_memo_garden_error)
-    test_app.errorhandler(Exception)(handle_internal_error)
+    for exc_class, handler in (
+        (ResourceNotFound, handle_not_found),
+        (ValidationError, handle_validation_error),
+        (MemoGardenError, handle_memo_garden_error),
+        (Exception, handle_internal_error),
+    ):
+        test_app.register_error_handler(exc_class, handler)
 
     # Register test routes
     @test_app.route('/test/not-found')
@@ -53,10 +55,10 @@ def error_app():
     return test_app
 
 
-@pytest.fixture
-def error_client(error_app):
-    """Create test client for error testing."""
-    return error_app.test_client()
+@pytest.fixture(scope="module")
+def error_client():
+    """Create test client for error testing, shared by the module."""
+    return _build_error_app().test_client()
 
 
 class TestExceptionClasses:
@@ -1,10 +1,15 @@
 """Tests for isodatetime module."""
 
 import pytest
+import time
 from datetime import datetime, date, UTC, timedelta
 from memogarden.utils import isodatetime
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+
 class TestToTimestamp:
     """Tests for to_timestamp function."""
 
@@ -57,12 +62,19 @@ class TestNow:
 
     def test_returns_recent_timestamp(self):
         """Should return timestamp within last second."""
-        before = datetime.now(UTC)
+        # Bracket with the same clock now() reads, at its microsecond precision
+        before = time.time_ns() // 1000
         result = isodatetime.now()
-        after = datetime.now(UTC)
+        after = time.time_ns() // 1000
 
         parsed = isodatetime.to_datetime(result)
-        assert before <= parsed <= after
+        assert before <= (parsed - _EPOCH) // _MICROSECOND <= after
+
+    def test_matches_to_timestamp_format(self):
+        """Should format exactly as to_timestamp does for the same instant."""
+        for _ in range(1000):
+            result = isodatetime.now()
+            assert isodatetime.to_timestamp(isodatetime.to_datetime(result)) == result
 
 
 class TestToDatestring:
@@ -89,22 +101,20 @@ class TestToDatestring:
 class TestRoundTrip:
     """Tests for round-trip conversion."""
 
-    def test_datetime_to_timestamp_to_datetime(self):
-        """Should preserve datetime through round-trip."""
-        original = datetime(2025, 12, 23, 10, 30, 0, tzinfo=UTC)
-        timestamp = isodatetime.to_timestamp(original)
-        result = isodatetime.to_datetime(timestamp)
-        assert result == original
-
-    def test_naive_datetime_round_trip(self):
-        """Naive datetime should become UTC-aware after round-trip."""
-        original = datetime(2025, 12, 23, 10, 30, 0)
-        timestamp = isodatetime.to_timestamp(original)
-        result = isodatetime.to_datetime(timestamp)
-        assert result.tzinfo == UTC
-        # Time should be preserved
-        assert result.hour == 10
-        assert result.minute == 30
+    def test_datetime_round_trip(self):
+        """Should preserve the instant through round-trip, as UTC-aware."""
+        samples = [
+            datetime(2025, 12, 23, 10, 30, 0, tzinfo=UTC),
+            datetime(2025, 12, 23, 10, 30, 0),  # Naive is treated as UTC
+            datetime(2025, 12, 23, 10, 30, 0, 123456, tzinfo=UTC),
+            datetime(2024, 2, 29, 23, 59, 59, 999999),
+        ]
+        to_timestamp, to_datetime = isodatetime.to_timestamp, isodatetime.to_datetime
+
+        for original in samples:
+            result = to_datetime(to_timestamp(original))
+            assert result == original.replace(tzinfo=UTC)
+            assert result.tzinfo == UTC
 
     def test_date_to_datestring_round_trip(self):
         """Date to datestring and back should preserve value."""
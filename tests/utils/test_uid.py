@@ -1,17 +1,11 @@
 """Tests for uid module."""
 
-import re
+from uuid import RFC_4122, UUID
+
 import pytest
 from memogarden.utils import uid
 
 
-# UUID v4 pattern: xxxxxxxx-xxxx-4xxx-yxxx-xxxxxxxxxxxx
-UUID_PATTERN = re.compile(
-    r'^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-    re.IGNORECASE
-)
-
-
 class TestGenerateUuid:
     """Tests for generate_uuid function."""
 
@@ -21,14 +15,23 @@ class TestGenerateUuid:
         assert isinstance(result, str)
 
     def test_returns_valid_uuid_v4_format(self):
-        """Should match UUID v4 pattern."""
+        """Should parse as an RFC 4122 version 4 UUID in canonical form."""
         result = uid.generate_uuid()
-        assert UUID_PATTERN.match(result) is not None
+        parsed = UUID(result)
+        assert parsed.version == 4
+        assert parsed.variant == RFC_4122
+        assert str(parsed) == result
 
     def test_returns_unique_values(self):
         """Multiple calls should return different values."""
-        results = [uid.generate_uuid() for _ in range(100)]
-        assert len(set(results)) == 100  # All unique
+        results = {uid.generate_uuid() for _ in range(100)}
+        assert len(results) == 100  # All unique
+
+    def test_unique_at_scale(self):
+        """10,000 calls should still return all-distinct values."""
+        n = 10_000
+        results = {uid.generate_uuid() for _ in range(n)}
+        assert len(results) == n
 
     def test_format_matches_expected_structure(self):
         """Should have hyphens in correct positions."""